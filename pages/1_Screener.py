@@ -3,17 +3,20 @@ Screener Page - Main Resume Screening Functionality
 This page contains all the resume screening logic from the original main.py
 """
 import streamlit as st
-import re
+import pandas as pd
 import os
-import requests
+import hashlib
+import functools
+import time
 from dotenv import load_dotenv
 
 # Import utility functions with error handling
 try:
-    from utils_v2.text_extraction import extract_resume_text, extract_jd_text
+    from utils_v2.text_extraction import extract_resume_text_cached, extract_jd_text
     from utils_v2.llm_functions import (
         extract_position_from_jd,
         extract_candidate_details_llm,
+        extract_details_fallback,
         extract_evaluation_points
     )
     from utils_v2.analysis import (
@@ -22,12 +25,15 @@ try:
         extract_scores,
         extract_summary_from_report,
         extract_failed_points_explanations,
-        process_single_resume
+        process_resumes_batch,
+        prewarm_bert_model
     )
     from utils_v2.tracker import (
         check_candidate_status_in_tracker,
-        update_tracker_excel
+        update_tracker_excel,
+        TrackerSession
     )
+    from utils_v2.naming import sanitize_name, position_folder
 except ImportError as e:
     st.error(f"❌ Import Error: {str(e)}")
     st.stop()
@@ -35,6 +41,116 @@ except ImportError as e:
 # Load environment variables from .env
 load_dotenv()
 
+
+def _save_upload(uploaded_file, path):
+    """Write an uploaded CV to path straight from its in-memory buffer (no intermediate bytes copy)"""
+    with uploaded_file.getbuffer() as view, open(path, "wb") as f:
+        f.write(view)
+
+
+# Seconds a base-folder existence check is reused before the filesystem is asked again
+_FOLDER_CHECK_TTL = 30.0
+
+
+def _folder_ok(path):
+    """True if path is an existing directory; one stat, remembered per session for _FOLDER_CHECK_TTL"""
+    now = time.monotonic()
+    cache = st.session_state.setdefault('_folder_ok_cache', {})
+    cached = cache.get(path)
+    if cached and now - cached[0] < _FOLDER_CHECK_TTL:
+        return cached[1]
+    ok = os.path.isdir(path)
+    cache[path] = (now, ok)
+    return ok
+
+# Green Shortlist / red Reject buttons for the Experiment batch table (rows use keyed containers)
+_BATCH_BUTTON_CSS = """
+<style>
+div[class*="st-key-shortlist-btn-"], div[class*="st-key-reject-btn-"] {
+    width: 100% !important;
+}
+div[class*="st-key-shortlist-btn-"] {
+    margin-bottom: 5px !important;
+}
+div[class*="st-key-reject-btn-"] {
+    margin-top: 5px !important;
+}
+div[class*="st-key-shortlist-btn-"] button {
+    background-color: #28a745 !important;
+    border-color: #28a745 !important;
+    color: white !important;
+    width: 100% !important;
+    min-height: 38px !important;
+    height: 38px !important;
+    padding: 0.5rem 1rem !important;
+}
+div[class*="st-key-reject-btn-"] button {
+    background-color: #dc3545 !important;
+    border-color: #dc3545 !important;
+    color: white !important;
+    width: 100% !important;
+    min-height: 38px !important;
+    height: 38px !important;
+    padding: 0.5rem 1rem !important;
+}
+</style>
+"""
+
+def _batch_display_fields(result):
+    """Display values for a batch result row, computed once and kept on the result across reruns"""
+    fields = result.get('display_fields')
+    if fields is None:
+        candidate_details = result.get('candidate_details') or {}
+        similarity_score = result.get('similarity_score', 0.0)
+        average_score = result.get('average_score', 0.0)
+        fields = {
+            'name': result.get('candidate_name', result.get('resume_file', 'Unknown')),
+            'position': result.get('position', 'Not Found'),
+            'experience': candidate_details.get('Total_Experience', 'Not Found'),
+            'location': candidate_details.get('Location', 'Not Found'),
+            'similarity_score': similarity_score,
+            'average_score': average_score,
+            'similarity_text': f"{similarity_score:.4f}",
+            'average_text': f"{average_score:.4f}",
+        }
+        result['display_fields'] = fields
+    return fields
+
+# Selected-state colours for the single-resume Shortlist / Reject buttons (keyed containers)
+_SINGLE_BUTTON_CSS = """
+<style>
+div[class*="st-key-single-shortlist-btn-"] button[kind="primary"] {
+    background-color: #28a745 !important;
+    border-color: #28a745 !important;
+    color: white !important;
+}
+div[class*="st-key-single-reject-btn-"] button[kind="primary"] {
+    background-color: #dc3545 !important;
+    border-color: #dc3545 !important;
+    color: white !important;
+}
+</style>
+"""
+
+# Page-wide shortlist/reject button colours (st.html skips the markdown parser on every rerun)
+_GLOBAL_BUTTON_CSS = """
+<style>
+    /* Green button for shortlisted state */
+    button[data-testid="baseButton-primary"][aria-label*="shortlist"] {
+        background-color: #28a745 !important;
+        border-color: #28a745 !important;
+        color: white !important;
+    }
+    
+    /* Red button for rejected state */
+    button[data-testid="baseButton-primary"][aria-label*="reject"] {
+        background-color: #dc3545 !important;
+        border-color: #dc3545 !important;
+        color: white !important;
+    }
+</style>
+"""
+
 # Helper function for Production Method auto-decision
 def apply_production_auto_decision(result, similarity_threshold, average_threshold):
     """Apply auto-decision logic for Production Method based on thresholds"""
@@ -49,40 +165,104 @@ def apply_production_auto_decision(result, similarity_threshold, average_thresho
     
     return decision
 
-def execute_production_auto_decision(result, decision, selected_base_folder, vendor_name, profile_shared_date, admin_override):
-    """Execute the auto-decision by shortlisting or rejecting the candidate"""
+def _jd_position(without_api_key=False):
+    """Position for the session's JD, remembered per (JD, model, endpoint) across reruns and clicks
+    
+    Without an API key this is "Not Found" unless without_api_key is set, in which case the
+    title-line/regex heuristics are used. The LLM answer itself is also cached in llm_functions.
+    """
+    job_desc = st.session_state.get('job_desc', '') or ''
+    api_key = st.session_state.api_key
+    if not job_desc.strip() or not (api_key or without_api_key):
+        return 'Not Found'
+    key = (
+        hashlib.blake2b(job_desc.encode('utf-8'), digest_size=16).hexdigest(),
+        bool(api_key), st.session_state.model_name, st.session_state.base_url
+    )
+    cached = st.session_state.get('_jd_position_cache')
+    if cached and cached[0] == key:
+        return cached[1]
+    try:
+        if api_key:
+            position = extract_position_from_jd(job_desc, api_key, st.session_state.model_name, st.session_state.base_url)
+        else:
+            position = extract_position_from_jd(job_desc, None, None, None)
+    except Exception:
+        return 'Not Found'
+    st.session_state._jd_position_cache = (key, position)
+    return position
+
+
+def _single_position():
+    """Position for the single-resume flow: extracted_position if known, else the JD lookup (stored back)"""
+    position = st.session_state.get('extracted_position', 'Not Found')
+    if not position or position == 'Not Found':
+        position = _jd_position()
+        st.session_state.extracted_position = position
+    return position
+
+
+def _single_candidate_details():
+    """Candidate details for the session's single resume, extracted once per (resume, model, endpoint)
+    
+    Returns a copy (callers set 'Position' on it), or None without an API key or resume text.
+    Only a successful LLM extraction is remembered; the regex fallback is recomputed per call.
+    """
+    resume_text = st.session_state.get('resume', '') or ''
+    api_key = st.session_state.api_key
+    if not api_key or not resume_text:
+        return None
+    key = (
+        hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).hexdigest(),
+        st.session_state.model_name, st.session_state.base_url
+    )
+    cached = st.session_state.get('_candidate_details_cache')
+    if cached and cached[0] == key:
+        return dict(cached[1])
+    details = extract_candidate_details_llm(
+        resume_text, api_key, st.session_state.model_name, st.session_state.base_url, use_fallback=False
+    )
+    if not details:
+        # LLM failed: use the regex fallback this time, but do not remember it so the next click retries
+        return extract_details_fallback(resume_text)
+    st.session_state._candidate_details_cache = (key, details)
+    return dict(details)
+
+
+def execute_production_auto_decision(result, decision, selected_base_folder, vendor_name, profile_shared_date, admin_override,
+                                     tracker_sessions=None):
+    """Execute the auto-decision by shortlisting or rejecting the candidate
+    
+    When tracker_sessions (a dict of position folder -> TrackerSession) is given, tracker
+    reads/writes are buffered there and the caller must flush the sessions afterwards.
+    """
     try:
         position_val = result.get('position', 'Not Found')
         if not position_val or position_val == 'Not Found':
-            job_desc = st.session_state.get('job_desc', '') or ''
-            if job_desc and job_desc.strip() and st.session_state.api_key:
-                try:
-                    position_val = extract_position_from_jd(
-                        job_desc,
-                        st.session_state.api_key,
-                        st.session_state.model_name,
-                        st.session_state.base_url
-                    )
-                except:
-                    position_val = 'Not Found'
+            position_val = _jd_position()
         
         if not selected_base_folder or not selected_base_folder.strip():
             return False, "Base folder path required"
         
-        # Validate that the base folder exists
-        if not os.path.exists(selected_base_folder) or not os.path.isdir(selected_base_folder):
+        # Validate that the base folder exists (already validated this run if it is the session's folder)
+        if selected_base_folder != st.session_state.get('selected_base_folder') and not _folder_ok(selected_base_folder):
             return False, f"Base folder does not exist: {selected_base_folder}"
         
-        position_clean = re.sub(r'[^\w\s-]', '', position_val)
-        position_clean = position_clean.replace(' ', '_').strip('_')
-        if not position_clean or position_clean == 'Not_Found':
-            position_clean = "Not_Found"
-        
-        position_folder = f"{position_clean}_Candidates"
-        # Use absolute path for base folder
-        base_folder_abs = os.path.abspath(selected_base_folder)
-        folder_name = os.path.join(base_folder_abs, position_folder)
-        os.makedirs(folder_name, exist_ok=True)
+        position_clean, folder_name = position_folder(selected_base_folder, position_val)
+        tracker_session = None
+        if tracker_sessions is not None:
+            # The session creates the position folder and its subfolders once per batch
+            if folder_name not in tracker_sessions:
+                tracker_sessions[folder_name] = TrackerSession(folder_name)
+            tracker_session = tracker_sessions[folder_name]
+            # Lets the caller report a failed flush() on the rows buffered in this session
+            result['tracker_folder'] = folder_name
+            check_status = tracker_session.check_candidate_status
+            update_tracker = tracker_session.update
+        else:
+            os.makedirs(folder_name, exist_ok=True)
+            check_status = functools.partial(check_candidate_status_in_tracker, folder_name=folder_name)
+            update_tracker = functools.partial(update_tracker_excel, folder_name=folder_name)
         
         candidate_details = result.get('candidate_details')
         if not candidate_details:
@@ -92,8 +272,8 @@ def execute_production_auto_decision(result, decision, selected_base_folder, ven
         candidate_name = candidate_details.get('Candidate_Name', 'Unknown')
         
         # Check if candidate already exists
-        exists, current_status, duplicate_reason, _ = check_candidate_status_in_tracker(
-            candidate_details, folder_name, vendor_name
+        exists, current_status, duplicate_reason, _ = check_status(
+            candidate_details, vendor_name=vendor_name
         )
         
         if exists:
@@ -111,10 +291,9 @@ def execute_production_auto_decision(result, decision, selected_base_folder, ven
                 average_score_val = result.get('average_score', 0.0)
                 file_path = ""
                 
-                excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
+                excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker(
                     candidate_details,
                     tracker_type="rejected",
-                    folder_name=folder_name,
                     feedback=feedback,
                     similarity_score=similarity_score_val,
                     average_score=average_score_val,
@@ -137,6 +316,8 @@ def execute_production_auto_decision(result, decision, selected_base_folder, ven
             feedback = extract_summary_from_report(full_report) if full_report else ''
         else:
             feedback = extract_failed_points_explanations(full_report) if full_report else ''
+        if result.get('fast_rejected'):
+            feedback = f"Similarity score {result.get('similarity_score', 0.0):.2f} below threshold; detailed report skipped"
         
         similarity_score_val = result.get('similarity_score', 0.0)
         average_score_val = result.get('average_score', 0.0)
@@ -146,28 +327,23 @@ def execute_production_auto_decision(result, decision, selected_base_folder, ven
         if decision == "Shortlisted":
             resume_file_obj = result.get('resume_file_obj')
             if resume_file_obj:
-                candidate_name_clean = re.sub(r'[^\w\s-]', '', candidate_name)
-                candidate_name_clean = candidate_name_clean.replace(' ', '_').strip('_')
-                if not candidate_name_clean:
-                    candidate_name_clean = "Unknown"
+                candidate_name_clean = sanitize_name(candidate_name)
                 
                 file_extension = os.path.splitext(resume_file_obj.name)[1]
                 new_filename = f"{position_clean}_{candidate_name_clean}{file_extension}"
                 
                 shortlisted_folder = os.path.join(folder_name, "Shortlisted")
-                os.makedirs(shortlisted_folder, exist_ok=True)
+                if tracker_session is None:
+                    os.makedirs(shortlisted_folder, exist_ok=True)
                 file_path = os.path.join(shortlisted_folder, new_filename)
                 file_path = os.path.abspath(file_path)
                 
-                resume_file_obj.seek(0)
-                with open(file_path, "wb") as f:
-                    f.write(resume_file_obj.getbuffer())
+                _save_upload(resume_file_obj, file_path)
         
         tracker_type = "shortlisted" if decision == "Shortlisted" else "rejected"
-        excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
+        excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker(
             candidate_details,
             tracker_type=tracker_type,
-            folder_name=folder_name,
             feedback=feedback,
             similarity_score=similarity_score_val,
             average_score=average_score_val,
@@ -185,6 +361,310 @@ def execute_production_auto_decision(result, decision, selected_base_folder, ven
     except Exception as e:
         return False, f"Error: {str(e)}"
 
+def _handle_batch_decision(decision, result, candidate_name, button_state_key, batch_results_key_prefix):
+    """Shortlist or reject one batch row; decision is "shortlisted" or "rejected"
+    
+    Same split as _handle_single_decision: only the report feedback, the CV copy into
+    Shortlisted/ and the message wording depend on the decision.
+    """
+    shortlisting = decision == "shortlisted"
+    extract_feedback = extract_summary_from_report if shortlisting else extract_failed_points_explanations
+    
+    position_val = result.get('position', 'Not Found')
+    if not position_val or position_val == 'Not Found':
+        position_val = _jd_position()
+    
+    selected_base_folder = st.session_state.get('selected_base_folder', '').strip()
+    if not selected_base_folder:
+        st.error(f"⚠️ Please select a base folder before {'shortlisting' if shortlisting else 'rejecting'} candidates.")
+        return
+    if not _folder_ok(selected_base_folder):
+        st.error(f"⚠️ Base folder does not exist: {selected_base_folder}. Please select a valid folder.")
+        return
+    
+    position_clean, folder_name = position_folder(selected_base_folder, position_val)
+    
+    candidate_details_val = result.get('candidate_details')
+    if not candidate_details_val:
+        st.warning(f"⚠️ Could not extract candidate details for {candidate_name}.")
+        return
+    candidate_details_val['Position'] = position_val if position_val and position_val != 'Not Found' else 'Not Found'
+    
+    vendor_name = st.session_state.get('vendor_name', '')
+    profile_shared_date = st.session_state.get('profile_shared_date', None)
+    admin_override = st.session_state.get('admin_override', False)
+    exists, current_status, duplicate_reason, _ = check_candidate_status_in_tracker(
+        candidate_details_val, folder_name, vendor_name
+    )
+    
+    if exists and not duplicate_reason.endswith("_different_vendor"):
+        st.warning(f"⚠️ **{candidate_name} already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
+        return
+    
+    full_report = result.get('report', '')
+    feedback = extract_feedback(full_report) if full_report else ''
+    similarity_score_val = result.get('similarity_score', 0.0)
+    average_score_val = result.get('average_score', 0.0)
+    
+    file_path = ""
+    if exists:
+        # Already in the tracker from a different vendor: recorded as a rejected 'Duplicate Profile'
+        tracker_type, new_state = "rejected", "duplicate"
+    else:
+        tracker_type, new_state = decision, decision
+        resume_file_obj = result.get('resume_file_obj')
+        if shortlisting and resume_file_obj:
+            candidate_name_clean = sanitize_name(candidate_details_val.get('Candidate_Name', 'Unknown'))
+            file_extension = os.path.splitext(resume_file_obj.name)[1]
+            new_filename = f"{position_clean}_{candidate_name_clean}{file_extension}"
+            
+            shortlisted_folder = os.path.join(folder_name, "Shortlisted")
+            os.makedirs(shortlisted_folder, exist_ok=True)
+            file_path = os.path.abspath(os.path.join(shortlisted_folder, new_filename))
+            
+            _save_upload(resume_file_obj, file_path)
+    
+    excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
+        candidate_details_val,
+        tracker_type=tracker_type,
+        folder_name=folder_name,
+        feedback=feedback,
+        similarity_score=similarity_score_val,
+        average_score=average_score_val,
+        cv_path=file_path,
+        vendor_name=vendor_name,
+        profile_shared_date=profile_shared_date,
+        allow_status_change=admin_override
+    )
+    
+    if added:
+        if exists:
+            st.success(f"✅ {candidate_name} added to tracker with 'Duplicate Profile' status (exists from different vendor).")
+        else:
+            st.success(f"✅ {candidate_name} {'shortlisted' if shortlisting else 'rejected'} successfully!")
+        if batch_results_key_prefix == "experiment":
+            st.session_state.experiment_batch_button_states[button_state_key] = new_state
+            st.session_state.show_thanking_note_batch = True
+        else:
+            st.session_state.production_batch_button_states[button_state_key] = new_state
+        # Full rerun: the thank-you note is rendered below the table, outside this row's fragment
+        st.rerun()
+    
+    if exists:
+        return
+    if duplicate_reason_ret.endswith("_same_vendor"):
+        st.warning(f"⚠️ **{candidate_name} already screened.** Current status: {status_ret}. Cannot change status.")
+    elif shortlisting:
+        st.warning(f"⚠️ **{candidate_name} already screened.** Duplicate entry prevented.")
+    else:
+        st.warning(f"⚠️ {candidate_name} already exists in tracker.")
+
+@st.fragment
+def _render_batch_row_actions(result, idx, batch_results_key_prefix, candidate_name):
+    """Shortlist / Reject buttons for one Experiment batch row
+    
+    Runs as a fragment, so clicks that end in a warning or error rerun only this row;
+    a recorded decision triggers a full rerun (see _handle_batch_decision).
+    """
+    button_state_key = f"{batch_results_key_prefix}_batch_btn_{idx}"
+    if batch_results_key_prefix == "experiment":
+        button_state = st.session_state.experiment_batch_button_states.get(button_state_key, None)
+    else:
+        button_state = st.session_state.production_batch_button_states.get(button_state_key, None)
+    
+    shortlist_button_key = f"shortlist_{batch_results_key_prefix}_batch_{idx}"
+    reject_button_key = f"reject_{batch_results_key_prefix}_batch_{idx}"
+    shortlist_container_id = f"shortlist-btn-{batch_results_key_prefix}-{idx}"
+    reject_container_id = f"reject-btn-{batch_results_key_prefix}-{idx}"
+    
+    if st.container(key=shortlist_container_id).button("✅ Shortlist", key=shortlist_button_key, type="primary" if button_state == "shortlisted" else "secondary", use_container_width=True):
+        try:
+            _handle_batch_decision("shortlisted", result, candidate_name, button_state_key, batch_results_key_prefix)
+        except Exception as e:
+            st.error(f"Error shortlisting {candidate_name}: {str(e)}")
+
+    if st.container(key=reject_container_id).button("❌ Reject", key=reject_button_key, type="primary" if button_state == "rejected" else "secondary", use_container_width=True):
+        try:
+            _handle_batch_decision("rejected", result, candidate_name, button_state_key, batch_results_key_prefix)
+        except Exception as e:
+            st.error(f"Error rejecting {candidate_name}: {str(e)}")
+
+
+def _handle_single_decision(decision, resume_file, analysis_method):
+    """Shortlist or reject the single uploaded resume; decision is "shortlisted" or "rejected"
+    
+    Both buttons share this path. They differ only in the report feedback that is recorded,
+    whether the CV is copied into Shortlisted/, and the wording of their messages.
+    """
+    shortlisting = decision == "shortlisted"
+    extract_feedback = extract_summary_from_report if shortlisting else extract_failed_points_explanations
+    button_state_key = "experiment_single_button_state" if analysis_method == "Experiment Method" else "production_single_button_state"
+    
+    position = _single_position()
+    
+    selected_base_folder = st.session_state.get('selected_base_folder', '').strip()
+    if not selected_base_folder:
+        st.error(f"⚠️ Please select a base folder before {'shortlisting' if shortlisting else 'rejecting'} candidates.")
+        st.stop()
+    elif not _folder_ok(selected_base_folder):
+        st.error(f"⚠️ Base folder does not exist: {selected_base_folder}. Please select a valid folder.")
+        st.stop()
+    
+    position_clean, folder_name = position_folder(selected_base_folder, position)
+    
+    if not (st.session_state.api_key and st.session_state.resume):
+        if shortlisting:
+            st.warning("API key required to extract candidate details for shortlisting.")
+        else:
+            st.warning("API key required to extract candidate details for rejection tracking.")
+        return
+    
+    with st.spinner("🔄 Extracting candidate details..."):
+        candidate_details = _single_candidate_details()
+        
+        if not candidate_details:
+            if shortlisting:
+                fallback_filename = resume_file.name
+                shortlisted_folder = os.path.join(folder_name, "Shortlisted")
+                os.makedirs(shortlisted_folder, exist_ok=True)
+                fallback_path = os.path.join(shortlisted_folder, fallback_filename)
+                _save_upload(resume_file, fallback_path)
+                st.warning(f"⚠️ CV saved as: {fallback_filename} (Could not extract candidate details. Please check your API key.)")
+            else:
+                st.warning("Could not extract candidate details. Please check your API key.")
+            return
+        
+        candidate_details['Position'] = position if position and position != 'Not Found' else 'Not Found'
+        
+        vendor_name = st.session_state.get('vendor_name', '')
+        profile_shared_date = st.session_state.get('profile_shared_date', None)
+        admin_override = st.session_state.get('admin_override', False)
+        exists, current_status, duplicate_reason, _ = check_candidate_status_in_tracker(
+            candidate_details, folder_name, vendor_name
+        )
+        
+        if exists and not duplicate_reason.endswith("_different_vendor"):
+            st.warning(f"⚠️ **Candidate already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
+            return
+        
+        full_report = st.session_state.get('report', '')
+        feedback = extract_feedback(full_report) if full_report else ''
+        similarity_score = st.session_state.get('similarity_score', 0.0)
+        average_score = st.session_state.get('average_score', 0.0)
+        
+        file_path = ""
+        if exists:
+            # Already in the tracker from a different vendor: recorded as a rejected 'Duplicate Profile'
+            tracker_type, new_state = "rejected", "duplicate"
+        else:
+            tracker_type, new_state = decision, decision
+            if shortlisting:
+                candidate_name_clean = sanitize_name(candidate_details.get('Candidate_Name', 'Unknown'))
+                file_extension = os.path.splitext(resume_file.name)[1]
+                new_filename = f"{position_clean}_{candidate_name_clean}{file_extension}"
+                
+                shortlisted_folder = os.path.join(folder_name, "Shortlisted")
+                os.makedirs(shortlisted_folder, exist_ok=True)
+                file_path = os.path.abspath(os.path.join(shortlisted_folder, new_filename))
+                
+                _save_upload(resume_file, file_path)
+        
+        excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
+            candidate_details,
+            tracker_type=tracker_type,
+            folder_name=folder_name,
+            feedback=feedback,
+            similarity_score=similarity_score,
+            average_score=average_score,
+            cv_path=file_path,
+            vendor_name=vendor_name,
+            profile_shared_date=profile_shared_date,
+            allow_status_change=admin_override
+        )
+        
+        if added:
+            if exists:
+                st.success("✅ Candidate added to tracker with 'Duplicate Profile' status (exists from different vendor).")
+            elif shortlisting:
+                st.success("✅ Candidate shortlisted successfully!")
+            else:
+                st.success("✅ Candidate rejected successfully!")
+            st.session_state[button_state_key] = new_state
+            st.session_state.show_thanking_note_single = True
+            # Called from the _render_single_decision_buttons fragment; only it needs redrawing
+            st.rerun(scope="fragment")
+        
+        if exists:
+            return
+        
+        if duplicate_reason_ret.endswith("_same_vendor") or duplicate_reason_ret == "already_exists":
+            st.warning(f"⚠️ **Candidate already screened.** Current status: {status_ret}. Cannot change status.")
+        else:
+            st.warning("⚠️ Candidate already exists in tracker. Duplicate entry prevented.")
+        
+        if shortlisting:
+            with st.expander("📋 Extracted Candidate Details", expanded=False):
+                st.write(f"**Name:** {candidate_details.get('Candidate_Name', 'N/A')}")
+                st.write(f"**Email:** {candidate_details.get('Email_ID', 'N/A')}")
+                st.write(f"**Position:** {candidate_details.get('Position', 'Not Found')}")
+                st.write(f"**Phone:** {candidate_details.get('Contact_Number', 'N/A')}")
+                st.write(f"**Experience:** {candidate_details.get('Total_Experience', 'N/A')}")
+                st.write(f"**Location:** {candidate_details.get('Location', 'N/A')}")
+                st.write(f"**Status:** {candidate_details.get('Resume_Screening_Status', 'N/A')}")
+                st.write(f"**Date:** {candidate_details.get('Screening_Date', 'N/A')}")
+                st.write(f"**Similarity Score:** {similarity_score:.4f}")
+                st.write(f"**Average Score:** {average_score:.4f}")
+
+@st.fragment
+def _render_single_decision_buttons():
+    """Shortlist / Reject buttons for the single-resume flow
+    
+    Runs as a fragment, so a decision reruns only these buttons and the thank-you note,
+    not the scores and report rendered above them.
+    """
+    col1, col2 = st.columns(2)
+    
+    # Read once for the buttons below
+    analysis_method = st.session_state.analysis_method
+    
+    if analysis_method == "Experiment Method":
+        current_action_resume_file = st.session_state.experiment_resume_file
+        single_button_state = st.session_state.get('experiment_single_button_state', None)
+    else:
+        current_action_resume_file = st.session_state.production_resume_file
+        single_button_state = st.session_state.get('production_single_button_state', None)
+    
+    single_shortlist_container_id = f"single-shortlist-btn-{analysis_method.lower().replace(' ', '-')}"
+    single_reject_container_id = f"single-reject-btn-{analysis_method.lower().replace(' ', '-')}"
+    
+    st.html(_SINGLE_BUTTON_CSS)
+    
+    with col1:
+        if st.container(key=single_shortlist_container_id).button("✅ Shortlist", type="primary" if single_button_state == "shortlisted" else "secondary", use_container_width=True):
+            if not current_action_resume_file:
+                st.error("No resume file found")
+            else:
+                try:
+                    _handle_single_decision("shortlisted", current_action_resume_file, analysis_method)
+                except Exception as e:
+                    st.error(f"Error saving file: {str(e)}")
+    
+    with col2:
+        if st.container(key=single_reject_container_id).button("❌ Reject", type="primary" if single_button_state == "rejected" else "secondary", use_container_width=True):
+            if not current_action_resume_file:
+                st.error("No resume file found")
+            else:
+                try:
+                    _handle_single_decision("rejected", current_action_resume_file, analysis_method)
+                except Exception as e:
+                    st.error(f"Error processing rejection: {str(e)}")
+    
+    if st.session_state.show_thanking_note_single:
+        st.markdown("---")
+        st.info("💬 Your selection has been processed. Thank you for utilizing Smart AI Recruiter to enhance your talent acquisition.")
+        st.session_state.show_thanking_note_single = False
+
+
 # Session States to store values - Optimized batch initialization
 _default_session_state = {
     "form_submitted": False,
@@ -225,52 +705,33 @@ _default_session_state = {
     "show_thanking_note_batch": False,
     "production_similarity_threshold": 0.7,
     "production_average_threshold": 0.6,
+    "production_fast_reject": False,
     "production_auto_decisions": {},
+    "max_concurrency": 4,
+    "selected_base_folder": "",
+    "vendor_name": "",
+    "profile_shared_date": None,
+    "last_jd_file_id": None,
+    "last_jd_text_id": None,
+    "evaluation_points_confirmed": False,
 }
 
-# Initialize session state efficiently
-for key, default_value in _default_session_state.items():
-    if key not in st.session_state:
-        st.session_state[key] = default_value
+# Initialize session state once per session with a single update
+if "_ss_initialized" not in st.session_state:
+    st.session_state.update({k: v for k, v in _default_session_state.items() if k not in st.session_state})
+    st.session_state._ss_initialized = True
 
-# Initialize base_url if not present
-if "base_url" not in st.session_state:
-    st.session_state.base_url = ""
+# Load the similarity model in the background while the user fills in the form
+prewarm_bert_model()
 
 # Page title (for Screener page)
 st.title("🔍 Screener - Resume Analysis")
 
 # Inject global CSS for button color customization
-st.markdown("""
-<style>
-    /* Green button for shortlisted state */
-    button[data-testid="baseButton-primary"][aria-label*="shortlist"] {
-        background-color: #28a745 !important;
-        border-color: #28a745 !important;
-        color: white !important;
-    }
-    
-    /* Red button for rejected state */
-    button[data-testid="baseButton-primary"][aria-label*="reject"] {
-        background-color: #dc3545 !important;
-        border-color: #dc3545 !important;
-        color: white !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.html(_GLOBAL_BUTTON_CSS)
 
 # <--------- Starting the Work Flow --------->
 
-# Initialize selected_base_folder in session state if not present (replaces client_name)
-if "selected_base_folder" not in st.session_state:
-    st.session_state.selected_base_folder = ""
-
-# Initialize vendor_name and profile_shared_date in session state
-if "vendor_name" not in st.session_state:
-    st.session_state.vendor_name = ""
-if "profile_shared_date" not in st.session_state:
-    st.session_state.profile_shared_date = None
-
 # Sidebar controls for API key and model selection (Generalized Approach)
 with st.sidebar:
     st.subheader("LLM Settings")
@@ -333,8 +794,8 @@ if base_folder_input:
     # Normalize the path (handles both Windows and Unix paths)
     folder_path = os.path.normpath(folder_path)
     
-    # Check if folder exists
-    if os.path.exists(folder_path) and os.path.isdir(folder_path):
+    # Check if folder exists (one stat, reused for _FOLDER_CHECK_TTL seconds)
+    if _folder_ok(folder_path):
         # Convert to absolute path
         folder_path = os.path.abspath(folder_path)
         st.session_state.selected_base_folder = folder_path
@@ -364,10 +825,6 @@ if profile_shared_date_input:
 else:
     st.session_state.profile_shared_date = None
 
-# Initialize previous method tracking
-if "prev_jd_method" not in st.session_state:
-    st.session_state.prev_jd_method = None
-
 # Initialize jd_input_method and jd_file variables (needed for Analyze button)
 jd_input_method = None
 jd_file = None
@@ -407,7 +864,7 @@ else:
         
         new_jd = st.text_area("Enter the Job Description of the role you are applying for:", placeholder="Job Description...", value=st.session_state.job_desc)
         if new_jd.strip():
-            current_jd_id = hash(new_jd.strip())
+            current_jd_id = hashlib.blake2b(new_jd.strip().encode('utf-8'), digest_size=16).hexdigest()
             if st.session_state.get('last_jd_text_id') != current_jd_id:
                 st.session_state.evaluation_points = []
                 st.session_state.selected_evaluation_points = []
@@ -421,7 +878,8 @@ else:
         jd_file = st.file_uploader(label="Upload Job Description (PDF, DOC, DOCX, or TXT)", type=["pdf","doc","docx","txt"])
         if jd_file:
             st.success(f"File uploaded: {jd_file.name}")
-            current_file_id = f"{jd_file.name}_{jd_file.size}"
+            # Key on the file contents so a re-uploaded file with the same name and size is still detected
+            current_file_id = hashlib.blake2b(jd_file.getvalue(), digest_size=16).hexdigest()
             if st.session_state.get('last_jd_file_id') != current_file_id:
                 with st.spinner("🔄 Extracting Job Description from document..."):
                     extracted_jd = extract_jd_text(jd_file)
@@ -435,12 +893,6 @@ else:
                     else:
                         st.error("Could not extract text from the Job Description document.")
 
-# Track if JD file/text was processed
-if "last_jd_file_id" not in st.session_state:
-    st.session_state.last_jd_file_id = None
-if "last_jd_text_id" not in st.session_state:
-    st.session_state.last_jd_text_id = None
-
 # Evaluation Points Extraction and Selection Section
 if st.session_state.selected_base_folder and st.session_state.selected_base_folder.strip() and st.session_state.job_desc and st.session_state.job_desc.strip():
     st.markdown("---")
@@ -468,10 +920,6 @@ if st.session_state.selected_base_folder and st.session_state.selected_base_fold
             st.error("⚠️ Please enter your API Key in the sidebar to extract evaluation points.")
             st.info("💡 Once API key is provided, evaluation points will be extracted automatically.")
     
-    # Initialize confirmation status
-    if "evaluation_points_confirmed" not in st.session_state:
-        st.session_state.evaluation_points_confirmed = False
-    
     # Experience Requirement Selection (Mandatory)
     st.write("**📊 Overall Work Experience Requirement** (Mandatory)")
     experience_options = [
@@ -633,6 +1081,11 @@ if (st.session_state.job_desc and st.session_state.job_desc.strip() and
                 help="Minimum average score required for auto-shortlisting (0.0 - 1.0)"
             )
         st.caption("💡 Candidates meeting both thresholds will be auto-shortlisted, others will be auto-rejected.")
+        st.session_state.production_fast_reject = st.checkbox(
+            "Fast-reject mode",
+            value=st.session_state.production_fast_reject,
+            help="Batch only: skip the detailed LLM report for resumes below the similarity threshold (they are rejected either way). Untick to get full reports for every resume."
+        )
         st.markdown("---")
         
         production_mode = st.radio(
@@ -711,7 +1164,7 @@ if st.button("Analyze", type="primary"):
     if current_processing_mode == "Single Resume Processing":
         if st.session_state.job_desc and current_resume_file:
             with st.spinner("🔄 Extracting Information"):
-                st.session_state.resume = extract_resume_text(current_resume_file)
+                st.session_state.resume = extract_resume_text_cached(current_resume_file)
 
             if not st.session_state.resume or not st.session_state.resume.strip():
                 st.error("We couldn't extract text from your resume. Please upload a selectable-text PDF or a DOC/DOCX file.")
@@ -752,32 +1205,35 @@ if st.button("Analyze", type="primary"):
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            for idx, resume_file in enumerate(current_resume_files):
-                status_text.text(f"Processing resume {idx + 1} of {len(current_resume_files)}: {resume_file.name}")
-                progress_bar.progress((idx + 1) / len(current_resume_files))
-                
-                try:
-                    result = process_single_resume(
-                        resume_file,
-                        st.session_state.job_desc,
-                        st.session_state.api_key,
-                        st.session_state.model_name,
-                        st.session_state.base_url,
-                        selected_points,
-                        experience_requirement=st.session_state.get('experience_requirement', None)
-                    )
-                    st.session_state[current_batch_results_key].append(result)
-                except Exception as e:
-                    st.session_state[current_batch_results_key].append({
-                        'resume_file': resume_file.name if resume_file else 'Unknown',
-                        'error': f'Error processing: {str(e)}',
-                        'candidate_name': 'Error',
-                        'position': 'Error',
-                        'similarity_score': 0.0,
-                        'average_score': 0.0,
-                        'report': '',
-                        'candidate_details': None
-                    })
+            total_files = len(current_resume_files)
+            status_text.text(f"Processing {total_files} resume(s)...")
+            
+            # At most ~100 progress updates per batch, however many resumes there are
+            progress_step = max(1, total_files // 100)
+            
+            def _on_resume_done(done, total, result):
+                if done % progress_step and done != total:
+                    return
+                status_text.text(f"Processed resume {done} of {total}: {result.get('resume_file', 'Unknown')}")
+                progress_bar.progress(done / total)
+            
+            # Resumes are processed concurrently; results come back in upload order
+            st.session_state[current_batch_results_key] = process_resumes_batch(
+                current_resume_files,
+                st.session_state.job_desc,
+                st.session_state.api_key,
+                st.session_state.model_name,
+                st.session_state.base_url,
+                selected_points,
+                experience_requirement=st.session_state.get('experience_requirement', None),
+                max_concurrency=st.session_state.get('max_concurrency', 4),
+                on_result=_on_resume_done,
+                min_similarity=(
+                    st.session_state.production_similarity_threshold
+                    if st.session_state.analysis_method == "Production Method" and st.session_state.production_fast_reject
+                    else None
+                )
+            )
             
             progress_bar.empty()
             status_text.empty()
@@ -794,18 +1250,34 @@ if st.button("Analyze", type="primary"):
                 
                 if selected_base_folder:
                     # Validate folder exists
-                    if os.path.exists(selected_base_folder) and os.path.isdir(selected_base_folder):
+                    if _folder_ok(selected_base_folder):
                         with st.spinner("🔄 Applying auto-decision based on thresholds..."):
-                            for idx, result in enumerate(st.session_state[current_batch_results_key]):
-                                if result.get('error'):
-                                    continue
-                                
-                                decision = apply_production_auto_decision(result, similarity_threshold, average_threshold)
-                                success, message = execute_production_auto_decision(
-                                    result, decision, selected_base_folder, vendor_name, profile_shared_date, admin_override
-                                )
-                                result['auto_decision'] = decision
-                                result['auto_decision_status'] = message
+                            # Tracker rows are buffered per position folder and each workbook is saved once
+                            tracker_sessions = {}
+                            # Rows whose tracker update is buffered in each session, by position folder
+                            session_rows = {}
+                            try:
+                                for idx, result in enumerate(st.session_state[current_batch_results_key]):
+                                    if result.get('error'):
+                                        continue
+                                    
+                                    decision = apply_production_auto_decision(result, similarity_threshold, average_threshold)
+                                    success, message = execute_production_auto_decision(
+                                        result, decision, selected_base_folder, vendor_name, profile_shared_date, admin_override,
+                                        tracker_sessions=tracker_sessions
+                                    )
+                                    result['auto_decision'] = decision
+                                    result['auto_decision_status'] = message
+                                    if success and result.get('tracker_folder'):
+                                        session_rows.setdefault(result['tracker_folder'], []).append(result)
+                            finally:
+                                # Save every workbook even if one fails (e.g. the tracker is open in Excel)
+                                for folder_name, tracker_session in tracker_sessions.items():
+                                    try:
+                                        tracker_session.flush()
+                                    except Exception as e:
+                                        for failed_result in session_rows.get(folder_name, []):
+                                            failed_result['auto_decision_status'] = f"Error: tracker not saved ({str(e)})"
                         
                         # Set thanking note for batch processing
                         st.session_state.show_thanking_note_batch = True
@@ -840,57 +1312,43 @@ if current_batch_complete and current_batch_results:
     if current_batch_results:
         # Production Method: Show summary table with Action column
         if st.session_state.analysis_method == "Production Method":
-            header_cols = st.columns([2, 2, 2, 1.5, 1.5, 2, 2])
-            header_cols[0].write("**Name**")
-            header_cols[1].write("**Position**")
-            header_cols[2].write("**Experience**")
-            header_cols[3].write("**Location**")
-            header_cols[4].write("**Similarity Score**")
-            header_cols[5].write("**Average Score**")
-            header_cols[6].write("**Action**")
-            st.markdown("---")
-            
-            for idx, result in enumerate(current_batch_results):
+            # One dataframe element for the whole batch instead of a row of columns per candidate
+            decision_labels = {"Shortlisted": "✅ Shortlisted", "Rejected": "❌ Rejected"}
+            summary_rows = []
+            for result in current_batch_results:
                 if result.get('error'):
                     st.warning(f"⚠️ {result.get('resume_file', 'Unknown')}: {result.get('error', 'Unknown error')}")
                     continue
                 
-                candidate_details = result.get('candidate_details', {})
-                candidate_name = result.get('candidate_name', result.get('resume_file', 'Unknown'))
-                position = result.get('position', 'Not Found')
-                total_experience = candidate_details.get('Total_Experience', 'Not Found')
-                location = candidate_details.get('Location', 'Not Found')
-                similarity_score = f"{result.get('similarity_score', 0.0):.4f}"
-                average_score = f"{result.get('average_score', 0.0):.4f}"
+                fields = _batch_display_fields(result)
                 auto_decision = result.get('auto_decision', 'Pending')
-                
-                row_cols = st.columns([2, 2, 2, 1.5, 1.5, 2, 2])
-                
-                with row_cols[0]:
-                    st.write(candidate_name)
-                with row_cols[1]:
-                    st.write(position)
-                with row_cols[2]:
-                    st.write(total_experience)
-                with row_cols[3]:
-                    st.write(location)
-                with row_cols[4]:
-                    st.write(similarity_score)
-                with row_cols[5]:
-                    st.write(average_score)
-                with row_cols[6]:
-                    if auto_decision == "Shortlisted":
-                        st.success(f"✅ {auto_decision}")
-                    elif auto_decision == "Rejected":
-                        st.error(f"❌ {auto_decision}")
-                    else:
-                        st.warning(f"⏳ {auto_decision}")
-                    # Show status message if available
-                    status_msg = result.get('auto_decision_status', '')
-                    if status_msg:
-                        st.caption(f"({status_msg})")
-                
-                st.markdown("---")
+                summary_rows.append({
+                    "Name": fields['name'],
+                    "Position": fields['position'],
+                    "Experience": fields['experience'],
+                    "Location": fields['location'],
+                    "Similarity Score": fields['similarity_score'],
+                    "Average Score": fields['average_score'],
+                    "Action": decision_labels.get(auto_decision, f"⏳ {auto_decision}"),
+                    "Status": result.get('auto_decision_status', ''),
+                })
+            
+            if summary_rows:
+                st.dataframe(
+                    pd.DataFrame(summary_rows),
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        "Similarity Score": st.column_config.ProgressColumn(
+                            "Similarity Score", min_value=0.0, max_value=1.0, format="%.4f"
+                        ),
+                        "Average Score": st.column_config.ProgressColumn(
+                            "Average Score", min_value=0.0, max_value=1.0, format="%.4f"
+                        ),
+                        "Action": st.column_config.TextColumn("Action"),
+                        "Status": st.column_config.TextColumn("Status"),
+                    }
+                )
             
             # Show thanking note for Production Method batch processing
             if st.session_state.show_thanking_note_batch:
@@ -910,333 +1368,34 @@ if current_batch_complete and current_batch_results:
             header_cols[6].write("**Actions**")
             st.markdown("---")
             
+            # One stylesheet for every row's buttons; each button sits in a keyed container
+            # (rendered with class st-key-<key>), so the rules match by class prefix
+            st.html(_BATCH_BUTTON_CSS)
+            
             for idx, result in enumerate(current_batch_results):
                 if result.get('error'):
                     st.warning(f"⚠️ {result.get('resume_file', 'Unknown')}: {result.get('error', 'Unknown error')}")
                     continue
                 
-                candidate_details = result.get('candidate_details', {})
-                candidate_name = result.get('candidate_name', result.get('resume_file', 'Unknown'))
-                position = result.get('position', 'Not Found')
-                total_experience = candidate_details.get('Total_Experience', 'Not Found')
-                location = candidate_details.get('Location', 'Not Found')
-                similarity_score = f"{result.get('similarity_score', 0.0):.4f}"
-                average_score = f"{result.get('average_score', 0.0):.4f}"
+                fields = _batch_display_fields(result)
+                candidate_name = fields['name']
                 
                 row_cols = st.columns([2, 2, 2, 1.5, 1.5, 2, 2])
                 
                 with row_cols[0]:
                     st.write(candidate_name)
                 with row_cols[1]:
-                    st.write(position)
+                    st.write(fields['position'])
                 with row_cols[2]:
-                    st.write(total_experience)
+                    st.write(fields['experience'])
                 with row_cols[3]:
-                    st.write(location)
+                    st.write(fields['location'])
                 with row_cols[4]:
-                    st.write(similarity_score)
+                    st.write(fields['similarity_text'])
                 with row_cols[5]:
-                    st.write(average_score)
+                    st.write(fields['average_text'])
                 with row_cols[6]:
-                    button_state_key = f"{batch_results_key_prefix}_batch_btn_{idx}"
-                    if batch_results_key_prefix == "experiment":
-                        button_state = st.session_state.experiment_batch_button_states.get(button_state_key, None)
-                    else:
-                        button_state = st.session_state.production_batch_button_states.get(button_state_key, None)
-                    
-                    shortlist_button_key = f"shortlist_{batch_results_key_prefix}_batch_{idx}"
-                    reject_button_key = f"reject_{batch_results_key_prefix}_batch_{idx}"
-                    shortlist_container_id = f"shortlist-btn-{batch_results_key_prefix}-{idx}"
-                    reject_container_id = f"reject-btn-{batch_results_key_prefix}-{idx}"
-                    
-                    st.markdown(f"""
-                    <style>
-                    div#{shortlist_container_id} {{
-                        width: 100% !important;
-                        margin-bottom: 5px !important;
-                    }}
-                    div#{shortlist_container_id} button[data-testid="baseButton-primary"],
-                    div#{shortlist_container_id} button[kind="primary"],
-                    div#{shortlist_container_id} button[data-testid="baseButton-secondary"],
-                    div#{shortlist_container_id} button[kind="secondary"] {{
-                        background-color: #28a745 !important;
-                        border-color: #28a745 !important;
-                        color: white !important;
-                        width: 100% !important;
-                        min-height: 38px !important;
-                        height: 38px !important;
-                        padding: 0.5rem 1rem !important;
-                    }}
-                    div#{reject_container_id} {{
-                        width: 100% !important;
-                        margin-top: 5px !important;
-                    }}
-                    div#{reject_container_id} button[data-testid="baseButton-primary"],
-                    div#{reject_container_id} button[kind="primary"],
-                    div#{reject_container_id} button[data-testid="baseButton-secondary"],
-                    div#{reject_container_id} button[kind="secondary"] {{
-                        background-color: #dc3545 !important;
-                        border-color: #dc3545 !important;
-                        color: white !important;
-                        width: 100% !important;
-                        min-height: 38px !important;
-                        height: 38px !important;
-                        padding: 0.5rem 1rem !important;
-                    }}
-                    </style>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown(f'<div id="{shortlist_container_id}">', unsafe_allow_html=True)
-                    if st.button(f"✅ Shortlist", key=shortlist_button_key, type="primary" if button_state == "shortlisted" else "secondary", use_container_width=True):
-                        try:
-                            position_val = result.get('position', 'Not Found')
-                            if not position_val or position_val == 'Not Found':
-                                job_desc = st.session_state.get('job_desc', '') or ''
-                                if job_desc and job_desc.strip() and st.session_state.api_key:
-                                    try:
-                                        position_val = extract_position_from_jd(
-                                            job_desc,
-                                            st.session_state.api_key,
-                                            st.session_state.model_name,
-                                            st.session_state.base_url
-                                        )
-                                    except:
-                                        position_val = 'Not Found'
-                            
-                            selected_base_folder = st.session_state.get('selected_base_folder', '').strip()
-                            if not selected_base_folder:
-                                st.error("⚠️ Please select a base folder before shortlisting candidates.")
-                            elif not os.path.exists(selected_base_folder) or not os.path.isdir(selected_base_folder):
-                                st.error(f"⚠️ Base folder does not exist: {selected_base_folder}. Please select a valid folder.")
-                            else:
-                                position_clean = re.sub(r'[^\w\s-]', '', position_val)
-                                position_clean = position_clean.replace(' ', '_').strip('_')
-                                if not position_clean or position_clean == 'Not_Found':
-                                    position_clean = "Not_Found"
-                                
-                                position_folder = f"{position_clean}_Candidates"
-                                base_folder_abs = os.path.abspath(selected_base_folder)
-                                folder_name = os.path.join(base_folder_abs, position_folder)
-                                os.makedirs(folder_name, exist_ok=True)
-                                
-                                candidate_details_val = result.get('candidate_details')
-                                if candidate_details_val:
-                                    candidate_details_val['Position'] = position_val if position_val and position_val != 'Not Found' else 'Not Found'
-                                    
-                                    vendor_name = st.session_state.get('vendor_name', '')
-                                    exists, current_status, duplicate_reason, _ = check_candidate_status_in_tracker(
-                                        candidate_details_val, folder_name, vendor_name
-                                    )
-                                    
-                                    if exists:
-                                        if duplicate_reason.endswith("_same_vendor"):
-                                            st.warning(f"⚠️ **{candidate_name} already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
-                                        elif duplicate_reason.endswith("_different_vendor"):
-                                            full_report = result.get('report', '')
-                                            feedback = extract_summary_from_report(full_report) if full_report else ''
-                                            similarity_score_val = result.get('similarity_score', 0.0)
-                                            average_score_val = result.get('average_score', 0.0)
-                                            file_path = ""
-                                            
-                                            profile_shared_date = st.session_state.get('profile_shared_date', None)
-                                            excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
-                                                candidate_details_val,
-                                                tracker_type="rejected",
-                                                folder_name=folder_name,
-                                                feedback=feedback,
-                                                similarity_score=similarity_score_val,
-                                                average_score=average_score_val,
-                                                cv_path=file_path,
-                                                vendor_name=vendor_name,
-                                                profile_shared_date=profile_shared_date,
-                                                allow_status_change=st.session_state.get('admin_override', False)
-                                            )
-                                            
-                                            if added:
-                                                st.success(f"✅ {candidate_name} added to tracker with 'Duplicate Profile' status (exists from different vendor).")
-                                                if batch_results_key_prefix == "experiment":
-                                                    st.session_state.experiment_batch_button_states[button_state_key] = "duplicate"
-                                                    st.session_state.show_thanking_note_batch = True
-                                                else:
-                                                    st.session_state.production_batch_button_states[button_state_key] = "duplicate"
-                                                st.rerun()
-                                        else:
-                                            st.warning(f"⚠️ **{candidate_name} already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
-                                    else:
-                                        full_report = result.get('report', '')
-                                        feedback = extract_summary_from_report(full_report) if full_report else ''
-                                        similarity_score_val = result.get('similarity_score', 0.0)
-                                        average_score_val = result.get('average_score', 0.0)
-                                        
-                                        file_path = ""
-                                        resume_file_obj = result.get('resume_file_obj')
-                                        if resume_file_obj:
-                                            candidate_name_clean = candidate_details_val.get('Candidate_Name', 'Unknown')
-                                            candidate_name_clean = re.sub(r'[^\w\s-]', '', candidate_name_clean)
-                                            candidate_name_clean = candidate_name_clean.replace(' ', '_').strip('_')
-                                            if not candidate_name_clean:
-                                                candidate_name_clean = "Unknown"
-                                            
-                                            file_extension = os.path.splitext(resume_file_obj.name)[1]
-                                            new_filename = f"{position_clean}_{candidate_name_clean}{file_extension}"
-                                            
-                                            shortlisted_folder = os.path.join(folder_name, "Shortlisted")
-                                            os.makedirs(shortlisted_folder, exist_ok=True)
-                                            file_path = os.path.join(shortlisted_folder, new_filename)
-                                            file_path = os.path.abspath(file_path)
-                                            
-                                            resume_file_obj.seek(0)
-                                            with open(file_path, "wb") as f:
-                                                f.write(resume_file_obj.getbuffer())
-                                        
-                                        profile_shared_date = st.session_state.get('profile_shared_date', None)
-                                        excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
-                                            candidate_details_val,
-                                            tracker_type="shortlisted",
-                                            folder_name=folder_name,
-                                            feedback=feedback,
-                                            similarity_score=similarity_score_val,
-                                            average_score=average_score_val,
-                                            cv_path=file_path,
-                                            vendor_name=vendor_name,
-                                            profile_shared_date=profile_shared_date,
-                                            allow_status_change=st.session_state.get('admin_override', False)
-                                        )
-                                        
-                                        if added:
-                                            st.success(f"✅ {candidate_name} shortlisted successfully!")
-                                            if batch_results_key_prefix == "experiment":
-                                                st.session_state.experiment_batch_button_states[button_state_key] = "shortlisted"
-                                                st.session_state.show_thanking_note_batch = True
-                                            else:
-                                                st.session_state.production_batch_button_states[button_state_key] = "shortlisted"
-                                            st.rerun()
-                                        else:
-                                            if duplicate_reason_ret.endswith("_same_vendor"):
-                                                st.warning(f"⚠️ **{candidate_name} already screened.** Current status: {status_ret}. Cannot change status.")
-                                            else:
-                                                st.warning(f"⚠️ **{candidate_name} already screened.** Duplicate entry prevented.")
-                                else:
-                                    st.warning(f"⚠️ Could not extract candidate details for {candidate_name}.")
-                        except Exception as e:
-                            st.error(f"Error shortlisting {candidate_name}: {str(e)}")
-                
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-                st.markdown(f'<div id="{reject_container_id}">', unsafe_allow_html=True)
-                if st.button(f"❌ Reject", key=reject_button_key, type="primary" if button_state == "rejected" else "secondary", use_container_width=True):
-                    try:
-                        position_val = result.get('position', 'Not Found')
-                        if not position_val or position_val == 'Not Found':
-                            job_desc = st.session_state.get('job_desc', '') or ''
-                            if job_desc and job_desc.strip() and st.session_state.api_key:
-                                try:
-                                    position_val = extract_position_from_jd(
-                                        job_desc,
-                                        st.session_state.api_key,
-                                        st.session_state.model_name,
-                                        st.session_state.base_url
-                                    )
-                                except:
-                                    position_val = 'Not Found'
-                        
-                        selected_base_folder = st.session_state.get('selected_base_folder', '').strip()
-                        if not selected_base_folder:
-                            st.error("⚠️ Please select a base folder before rejecting candidates.")
-                        elif not os.path.exists(selected_base_folder) or not os.path.isdir(selected_base_folder):
-                            st.error(f"⚠️ Base folder does not exist: {selected_base_folder}. Please select a valid folder.")
-                        else:
-                            position_clean = re.sub(r'[^\w\s-]', '', position_val)
-                            position_clean = position_clean.replace(' ', '_').strip('_')
-                            if not position_clean or position_clean == 'Not_Found':
-                                position_clean = "Not_Found"
-                            
-                            position_folder = f"{position_clean}_Candidates"
-                            base_folder_abs = os.path.abspath(selected_base_folder)
-                            folder_name = os.path.join(base_folder_abs, position_folder)
-                            os.makedirs(folder_name, exist_ok=True)
-                            
-                            candidate_details_val = result.get('candidate_details')
-                            if candidate_details_val:
-                                candidate_details_val['Position'] = position_val if position_val and position_val != 'Not Found' else 'Not Found'
-                                
-                                vendor_name = st.session_state.get('vendor_name', '')
-                                exists, current_status, duplicate_reason, _ = check_candidate_status_in_tracker(
-                                    candidate_details_val, folder_name, vendor_name
-                                )
-                                
-                                if exists:
-                                    if duplicate_reason.endswith("_same_vendor"):
-                                        st.warning(f"⚠️ **{candidate_name} already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
-                                    elif duplicate_reason.endswith("_different_vendor"):
-                                        full_report = result.get('report', '')
-                                        feedback = extract_failed_points_explanations(full_report) if full_report else ''
-                                        similarity_score_val = result.get('similarity_score', 0.0)
-                                        average_score_val = result.get('average_score', 0.0)
-                                        file_path = ""
-                                        
-                                        profile_shared_date = st.session_state.get('profile_shared_date', None)
-                                        excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
-                                            candidate_details_val,
-                                            tracker_type="rejected",
-                                            folder_name=folder_name,
-                                            feedback=feedback,
-                                            similarity_score=similarity_score_val,
-                                            average_score=average_score_val,
-                                            cv_path=file_path,
-                                            vendor_name=vendor_name,
-                                            profile_shared_date=profile_shared_date,
-                                            allow_status_change=st.session_state.get('admin_override', False)
-                                        )
-                                        
-                                        if added:
-                                            st.success(f"✅ {candidate_name} added to tracker with 'Duplicate Profile' status (exists from different vendor).")
-                                            if batch_results_key_prefix == "experiment":
-                                                st.session_state.experiment_batch_button_states[button_state_key] = "duplicate"
-                                                st.session_state.show_thanking_note_batch = True
-                                            else:
-                                                st.session_state.production_batch_button_states[button_state_key] = "duplicate"
-                                            st.rerun()
-                                    else:
-                                        st.warning(f"⚠️ **{candidate_name} already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
-                                else:
-                                    full_report = result.get('report', '')
-                                    feedback = extract_failed_points_explanations(full_report) if full_report else ''
-                                    similarity_score_val = result.get('similarity_score', 0.0)
-                                    average_score_val = result.get('average_score', 0.0)
-                                    
-                                    profile_shared_date = st.session_state.get('profile_shared_date', None)
-                                    excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
-                                        candidate_details_val,
-                                        tracker_type="rejected",
-                                        folder_name=folder_name,
-                                        feedback=feedback,
-                                        similarity_score=similarity_score_val,
-                                        average_score=average_score_val,
-                                        vendor_name=vendor_name,
-                                        profile_shared_date=profile_shared_date,
-                                        allow_status_change=st.session_state.get('admin_override', False)
-                                    )
-                                    
-                                    if added:
-                                        st.success(f"✅ {candidate_name} rejected successfully!")
-                                        if batch_results_key_prefix == "experiment":
-                                            st.session_state.experiment_batch_button_states[button_state_key] = "rejected"
-                                            st.session_state.show_thanking_note_batch = True
-                                        else:
-                                            st.session_state.production_batch_button_states[button_state_key] = "rejected"
-                                        st.rerun()
-                                    else:
-                                        if duplicate_reason_ret.endswith("_same_vendor"):
-                                            st.warning(f"⚠️ **{candidate_name} already screened.** Current status: {status_ret}. Cannot change status.")
-                                        else:
-                                            st.warning(f"⚠️ {candidate_name} already exists in tracker.")
-                            else:
-                                st.warning(f"⚠️ Could not extract candidate details for {candidate_name}.")
-                    except Exception as e:
-                        st.error(f"Error rejecting {candidate_name}: {str(e)}")
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+                    _render_batch_row_actions(result, idx, batch_results_key_prefix, candidate_name)
             
             st.markdown("---")
         
@@ -1300,31 +1459,7 @@ if (method_form_submitted or st.session_state.form_submitted) and method_process
             st.session_state.average_score = avg_score
             st.session_state.report_scores = report_scores
             
-            job_desc = st.session_state.get('job_desc', '') or ''
-            if job_desc and job_desc.strip() and st.session_state.api_key:
-                try:
-                    extracted_position = extract_position_from_jd(
-                        job_desc,
-                        st.session_state.api_key,
-                        st.session_state.model_name,
-                        st.session_state.base_url
-                    )
-                    st.session_state.extracted_position = extracted_position
-                except:
-                    st.session_state.extracted_position = "Not Found"
-            elif job_desc and job_desc.strip():
-                try:
-                    extracted_position = extract_position_from_jd(
-                        job_desc,
-                        None,
-                        None,
-                        None
-                    )
-                    st.session_state.extracted_position = extracted_position
-                except:
-                    st.session_state.extracted_position = "Not Found"
-            else:
-                st.session_state.extracted_position = "Not Found"
+            st.session_state.extracted_position = _jd_position(without_api_key=True)
         
         st.success("✅ Scores generated successfully!")
         
@@ -1336,7 +1471,7 @@ if (method_form_submitted or st.session_state.form_submitted) and method_process
             
             if selected_base_folder:
                 # Validate folder exists
-                if os.path.exists(selected_base_folder) and os.path.isdir(selected_base_folder):
+                if _folder_ok(selected_base_folder):
                     # Create result dict for auto-decision
                     result_dict = {
                         'similarity_score': ats_score,
@@ -1350,16 +1485,11 @@ if (method_form_submitted or st.session_state.form_submitted) and method_process
                     # Extract candidate details if API key available
                     if st.session_state.api_key and st.session_state.resume:
                         try:
-                            candidate_details = extract_candidate_details_llm(
-                                st.session_state.resume,
-                                st.session_state.api_key,
-                                st.session_state.model_name,
-                                st.session_state.base_url
-                            )
+                            candidate_details = _single_candidate_details()
                             if candidate_details:
                                 result_dict['candidate_details'] = candidate_details
                                 result_dict['candidate_name'] = candidate_details.get('Candidate_Name', 'Unknown')
-                        except:
+                        except Exception:
                             pass
                     
                     # Apply auto-decision
@@ -1401,20 +1531,7 @@ if (method_form_submitted or st.session_state.form_submitted) and method_process
             st.session_state.report_scores = report_scores
         
         if 'extracted_position' not in st.session_state:
-            job_desc = st.session_state.get('job_desc', '') or ''
-            if job_desc and job_desc.strip() and st.session_state.api_key:
-                try:
-                    extracted_position = extract_position_from_jd(
-                        job_desc,
-                        st.session_state.api_key,
-                        st.session_state.model_name,
-                        st.session_state.base_url
-                    )
-                    st.session_state.extracted_position = extracted_position
-                except:
-                    st.session_state.extracted_position = "Not Found"
-            else:
-                st.session_state.extracted_position = "Not Found"
+            st.session_state.extracted_position = _jd_position()
 
     # Display scores
     col1, col2 = st.columns(2, border=True)
@@ -1473,17 +1590,12 @@ if (method_form_submitted or st.session_state.form_submitted) and method_process
         
         if st.session_state.api_key and st.session_state.resume:
             try:
-                candidate_details = extract_candidate_details_llm(
-                    st.session_state.resume,
-                    st.session_state.api_key,
-                    st.session_state.model_name,
-                    st.session_state.base_url
-                )
+                candidate_details = _single_candidate_details()
                 if candidate_details:
                     candidate_name = candidate_details.get('Candidate_Name', 'Unknown')
                     total_experience = candidate_details.get('Total_Experience', 'Not Found')
                     location = candidate_details.get('Location', 'Not Found')
-            except:
+            except Exception:
                 pass
         
         # Display summary table
@@ -1525,359 +1637,7 @@ if (method_form_submitted or st.session_state.form_submitted) and method_process
     
     # Experiment Method: Show manual buttons
     else:
-        col1, col2 = st.columns(2)
-        
-        if st.session_state.analysis_method == "Experiment Method":
-            current_action_resume_file = st.session_state.experiment_resume_file
-            single_button_state = st.session_state.get('experiment_single_button_state', None)
-        else:
-            current_action_resume_file = st.session_state.production_resume_file
-            single_button_state = st.session_state.get('production_single_button_state', None)
-        
-        single_shortlist_container_id = f"single-shortlist-btn-{st.session_state.analysis_method.lower().replace(' ', '-')}"
-        single_reject_container_id = f"single-reject-btn-{st.session_state.analysis_method.lower().replace(' ', '-')}"
-        
-        st.markdown(f"""
-        <style>
-        div#{single_shortlist_container_id} button[data-testid="baseButton-primary"],
-        div#{single_shortlist_container_id} button[kind="primary"] {{
-            background-color: #28a745 !important;
-            border-color: #28a745 !important;
-            color: white !important;
-        }}
-        div#{single_reject_container_id} button[data-testid="baseButton-primary"],
-        div#{single_reject_container_id} button[kind="primary"] {{
-            background-color: #dc3545 !important;
-            border-color: #dc3545 !important;
-            color: white !important;
-        }}
-        </style>
-        """, unsafe_allow_html=True)
-        
-        with col1:
-            st.markdown(f'<div id="{single_shortlist_container_id}">', unsafe_allow_html=True)
-            if st.button("✅ Shortlist", type="primary" if single_button_state == "shortlisted" else "secondary", use_container_width=True):
-                if not current_action_resume_file:
-                    st.error("No resume file found")
-                elif current_action_resume_file:
-                    try:
-                        position = st.session_state.get('extracted_position', 'Not Found')
-                        
-                        if not position or position == 'Not Found':
-                            job_desc = st.session_state.get('job_desc', '') or ''
-                            if job_desc and job_desc.strip() and st.session_state.api_key:
-                                try:
-                                    position = extract_position_from_jd(
-                                        job_desc,
-                                        st.session_state.api_key,
-                                        st.session_state.model_name,
-                                        st.session_state.base_url
-                                    )
-                                    st.session_state.extracted_position = position
-                                except Exception as e:
-                                    position = 'Not Found'
-                                    st.session_state.extracted_position = position
-                        
-                        selected_base_folder = st.session_state.get('selected_base_folder', '').strip()
-                        if not selected_base_folder:
-                            st.error("⚠️ Please select a base folder before shortlisting candidates.")
-                            st.stop()
-                        elif not os.path.exists(selected_base_folder) or not os.path.isdir(selected_base_folder):
-                            st.error(f"⚠️ Base folder does not exist: {selected_base_folder}. Please select a valid folder.")
-                            st.stop()
-                        
-                        position_clean = re.sub(r'[^\w\s-]', '', position)
-                        position_clean = position_clean.replace(' ', '_').strip('_')
-                        if not position_clean or position_clean == 'Not_Found':
-                            position_clean = "Not_Found"
-                        
-                        position_folder = f"{position_clean}_Candidates"
-                        base_folder_abs = os.path.abspath(selected_base_folder)
-                        folder_name = os.path.join(base_folder_abs, position_folder)
-                        os.makedirs(folder_name, exist_ok=True)
-                        
-                        candidate_details = None
-                        candidate_name = "Unknown"
-                        file_extension = os.path.splitext(current_action_resume_file.name)[1]
-                        
-                        if st.session_state.api_key and st.session_state.resume:
-                            with st.spinner("🔄 Extracting candidate details..."):
-                                candidate_details = extract_candidate_details_llm(
-                                    st.session_state.resume, 
-                                    st.session_state.api_key, 
-                                    st.session_state.model_name, 
-                                    st.session_state.base_url
-                                )
-                                
-                                if candidate_details:
-                                    candidate_details['Position'] = position if position and position != 'Not Found' else 'Not Found'
-                                    
-                                    candidate_name = candidate_details.get('Candidate_Name', 'Unknown')
-                                    candidate_name_clean = re.sub(r'[^\w\s-]', '', candidate_name)
-                                    candidate_name_clean = candidate_name_clean.replace(' ', '_').strip('_')
-                                    if not candidate_name_clean:
-                                        candidate_name_clean = "Unknown"
-                                    
-                                    vendor_name = st.session_state.get('vendor_name', '')
-                                    exists, current_status, duplicate_reason, _ = check_candidate_status_in_tracker(
-                                        candidate_details, folder_name, vendor_name
-                                    )
-                                    
-                                    if exists:
-                                        if duplicate_reason.endswith("_same_vendor"):
-                                            st.warning(f"⚠️ **Candidate already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
-                                        elif duplicate_reason.endswith("_different_vendor"):
-                                            file_path = ""
-                                            
-                                            full_report = st.session_state.get('report', '')
-                                            feedback = extract_summary_from_report(full_report) if full_report else ''
-                                            similarity_score = st.session_state.get('similarity_score', 0.0)
-                                            average_score = st.session_state.get('average_score', 0.0)
-                                            
-                                            profile_shared_date = st.session_state.get('profile_shared_date', None)
-                                            excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
-                                                candidate_details, 
-                                                tracker_type="rejected",
-                                                folder_name=folder_name,
-                                                feedback=feedback,
-                                                similarity_score=similarity_score,
-                                                average_score=average_score,
-                                                cv_path=file_path,
-                                                vendor_name=vendor_name,
-                                                profile_shared_date=profile_shared_date,
-                                                allow_status_change=st.session_state.get('admin_override', False)
-                                            )
-                                            
-                                            if added:
-                                                st.success("✅ Candidate added to tracker with 'Duplicate Profile' status (exists from different vendor).")
-                                                if st.session_state.analysis_method == "Experiment Method":
-                                                    st.session_state.experiment_single_button_state = "duplicate"
-                                                else:
-                                                    st.session_state.production_single_button_state = "duplicate"
-                                                st.session_state.show_thanking_note_single = True
-                                                st.rerun()
-                                        else:
-                                            st.warning(f"⚠️ **Candidate already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
-                                    else:
-                                        new_filename = f"{position_clean}_{candidate_name_clean}{file_extension}"
-                                        
-                                        shortlisted_folder = os.path.join(folder_name, "Shortlisted")
-                                        os.makedirs(shortlisted_folder, exist_ok=True)
-                                        file_path = os.path.join(shortlisted_folder, new_filename)
-                                        file_path = os.path.abspath(file_path)
-                                        
-                                        current_action_resume_file.seek(0)
-                                        with open(file_path, "wb") as f:
-                                            f.write(current_action_resume_file.getbuffer())
-                                        
-                                        full_report = st.session_state.get('report', '')
-                                        feedback = extract_summary_from_report(full_report) if full_report else ''
-                                        similarity_score = st.session_state.get('similarity_score', 0.0)
-                                        average_score = st.session_state.get('average_score', 0.0)
-                                        
-                                        profile_shared_date = st.session_state.get('profile_shared_date', None)
-                                        excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
-                                            candidate_details, 
-                                            tracker_type="shortlisted",
-                                            folder_name=folder_name,
-                                            feedback=feedback,
-                                            similarity_score=similarity_score,
-                                            average_score=average_score,
-                                            cv_path=file_path,
-                                            vendor_name=vendor_name,
-                                            profile_shared_date=profile_shared_date,
-                                            allow_status_change=st.session_state.get('admin_override', False)
-                                        )
-                                        
-                                        if added:
-                                            st.success("✅ Candidate shortlisted successfully!")
-                                            if st.session_state.analysis_method == "Experiment Method":
-                                                st.session_state.experiment_single_button_state = "shortlisted"
-                                            else:
-                                                st.session_state.production_single_button_state = "shortlisted"
-                                            st.session_state.show_thanking_note_single = True
-                                            st.rerun()
-                                        else:
-                                            if duplicate_reason_ret.endswith("_same_vendor"):
-                                                duplicate_msg = f"⚠️ **Candidate already screened.** Current status: {status_ret}. Cannot change status."
-                                            elif duplicate_reason_ret == "already_exists":
-                                                duplicate_msg = f"⚠️ **Candidate already screened.** Current status: {status_ret}. Cannot change status."
-                                            else:
-                                                duplicate_msg = f"⚠️ Candidate already exists in tracker. Duplicate entry prevented."
-                                            
-                                            st.warning(duplicate_msg)
-                                            
-                                        with st.expander("📋 Extracted Candidate Details", expanded=False):
-                                            st.write(f"**Name:** {candidate_details.get('Candidate_Name', 'N/A')}")
-                                            st.write(f"**Email:** {candidate_details.get('Email_ID', 'N/A')}")
-                                            st.write(f"**Position:** {candidate_details.get('Position', 'Not Found')}")
-                                            st.write(f"**Phone:** {candidate_details.get('Contact_Number', 'N/A')}")
-                                            st.write(f"**Experience:** {candidate_details.get('Total_Experience', 'N/A')}")
-                                            st.write(f"**Location:** {candidate_details.get('Location', 'N/A')}")
-                                            st.write(f"**Status:** {candidate_details.get('Resume_Screening_Status', 'N/A')}")
-                                            st.write(f"**Date:** {candidate_details.get('Screening_Date', 'N/A')}")
-                                            st.write(f"**Similarity Score:** {similarity_score:.4f}")
-                                            st.write(f"**Average Score:** {average_score:.4f}")
-                                else:
-                                    fallback_filename = current_action_resume_file.name
-                                    shortlisted_folder = os.path.join(folder_name, "Shortlisted")
-                                    os.makedirs(shortlisted_folder, exist_ok=True)
-                                    fallback_path = os.path.join(shortlisted_folder, fallback_filename)
-                                    current_action_resume_file.seek(0)
-                                    with open(fallback_path, "wb") as f:
-                                        f.write(current_action_resume_file.getbuffer())
-                                    st.warning(f"⚠️ CV saved as: {fallback_filename} (Could not extract candidate details. Please check your API key.)")
-                        else:
-                            st.warning("API key required to extract candidate details for shortlisting.")
-                    
-                    except Exception as e:
-                        st.error(f"Error saving file: {str(e)}")
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f'<div id="{single_reject_container_id}">', unsafe_allow_html=True)
-            if st.button("❌ Reject", type="primary" if single_button_state == "rejected" else "secondary", use_container_width=True):
-                if not current_action_resume_file:
-                    st.error("No resume file found")
-                elif current_action_resume_file:
-                    try:
-                        position = st.session_state.get('extracted_position', 'Not Found')
-                        
-                        if not position or position == 'Not Found':
-                            job_desc = st.session_state.get('job_desc', '') or ''
-                            if job_desc and job_desc.strip() and st.session_state.api_key:
-                                try:
-                                    position = extract_position_from_jd(
-                                        job_desc,
-                                        st.session_state.api_key,
-                                        st.session_state.model_name,
-                                        st.session_state.base_url
-                                    )
-                                    st.session_state.extracted_position = position
-                                except Exception as e:
-                                    position = 'Not Found'
-                        
-                        selected_base_folder = st.session_state.get('selected_base_folder', '').strip()
-                        if not selected_base_folder:
-                            st.error("⚠️ Please select a base folder before rejecting candidates.")
-                            st.stop()
-                        elif not os.path.exists(selected_base_folder) or not os.path.isdir(selected_base_folder):
-                            st.error(f"⚠️ Base folder does not exist: {selected_base_folder}. Please select a valid folder.")
-                            st.stop()
-                        
-                        position_clean = re.sub(r'[^\w\s-]', '', position)
-                        position_clean = position_clean.replace(' ', '_').strip('_')
-                        if not position_clean or position_clean == 'Not_Found':
-                            position_clean = "Not_Found"
-                        
-                        position_folder = f"{position_clean}_Candidates"
-                        base_folder_abs = os.path.abspath(selected_base_folder)
-                        folder_name = os.path.join(base_folder_abs, position_folder)
-                        os.makedirs(folder_name, exist_ok=True)
-                        
-                        if st.session_state.api_key and st.session_state.resume:
-                            with st.spinner("🔄 Extracting candidate details..."):
-                                candidate_details = extract_candidate_details_llm(
-                                    st.session_state.resume, 
-                                    st.session_state.api_key, 
-                                    st.session_state.model_name, 
-                                    st.session_state.base_url
-                                )
-                                
-                                if candidate_details:
-                                    candidate_details['Position'] = position if position and position != 'Not Found' else 'Not Found'
-                                    
-                                    vendor_name = st.session_state.get('vendor_name', '')
-                                    exists, current_status, duplicate_reason, _ = check_candidate_status_in_tracker(
-                                        candidate_details, folder_name, vendor_name
-                                    )
-                                    
-                                    if exists:
-                                        if duplicate_reason.endswith("_same_vendor"):
-                                            st.warning(f"⚠️ **Candidate already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
-                                        elif duplicate_reason.endswith("_different_vendor"):
-                                            file_path = ""
-                                            
-                                            full_report = st.session_state.get('report', '')
-                                            feedback = extract_failed_points_explanations(full_report) if full_report else ''
-                                            similarity_score = st.session_state.get('similarity_score', 0.0)
-                                            average_score = st.session_state.get('average_score', 0.0)
-                                            
-                                            profile_shared_date = st.session_state.get('profile_shared_date', None)
-                                            excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
-                                                candidate_details, 
-                                                tracker_type="rejected",
-                                                folder_name=folder_name,
-                                                feedback=feedback,
-                                                similarity_score=similarity_score,
-                                                average_score=average_score,
-                                                cv_path=file_path,
-                                                vendor_name=vendor_name,
-                                                profile_shared_date=profile_shared_date,
-                                                allow_status_change=st.session_state.get('admin_override', False)
-                                            )
-                                            
-                                            if added:
-                                                st.success("✅ Candidate added to tracker with 'Duplicate Profile' status (exists from different vendor).")
-                                                if st.session_state.analysis_method == "Experiment Method":
-                                                    st.session_state.experiment_single_button_state = "duplicate"
-                                                else:
-                                                    st.session_state.production_single_button_state = "duplicate"
-                                                st.session_state.show_thanking_note_single = True
-                                                st.rerun()
-                                        else:
-                                            st.warning(f"⚠️ **Candidate already screened.** Current status: **{current_status}**. Cannot change status (first come first serve).")
-                                    else:
-                                        full_report = st.session_state.get('report', '')
-                                        feedback = extract_failed_points_explanations(full_report) if full_report else ''
-                                        similarity_score = st.session_state.get('similarity_score', 0.0)
-                                        average_score = st.session_state.get('average_score', 0.0)
-                                        
-                                        profile_shared_date = st.session_state.get('profile_shared_date', None)
-                                        excel_path, added, duplicate_reason_ret, profile_remark, status_ret = update_tracker_excel(
-                                            candidate_details, 
-                                            tracker_type="rejected",
-                                            folder_name=folder_name,
-                                            feedback=feedback,
-                                            similarity_score=similarity_score,
-                                            average_score=average_score,
-                                            vendor_name=vendor_name,
-                                            profile_shared_date=profile_shared_date,
-                                            allow_status_change=st.session_state.get('admin_override', False)
-                                        )
-                                        
-                                        if added:
-                                            st.success("✅ Candidate rejected successfully!")
-                                            if st.session_state.analysis_method == "Experiment Method":
-                                                st.session_state.experiment_single_button_state = "rejected"
-                                            else:
-                                                st.session_state.production_single_button_state = "rejected"
-                                            st.session_state.show_thanking_note_single = True
-                                            st.rerun()
-                                        else:
-                                            if duplicate_reason_ret.endswith("_same_vendor"):
-                                                duplicate_msg = f"⚠️ **Candidate already screened.** Current status: {status_ret}. Cannot change status."
-                                            elif duplicate_reason_ret == "already_exists":
-                                                duplicate_msg = f"⚠️ **Candidate already screened.** Current status: {status_ret}. Cannot change status."
-                                            else:
-                                                duplicate_msg = f"⚠️ Candidate already exists in tracker. Duplicate entry prevented."
-                                            
-                                            st.warning(duplicate_msg)
-                                else:
-                                    st.warning("Could not extract candidate details. Please check your API key.")
-                        else:
-                            st.warning("API key required to extract candidate details for rejection tracking.")
-                            
-                    except Exception as e:
-                        st.error(f"Error processing rejection: {str(e)}")
-            
-            st.markdown('</div>', unsafe_allow_html=True)
-    
-    if st.session_state.show_thanking_note_single:
-        st.markdown("---")
-        st.info("💬 Your selection has been processed. Thank you for utilizing Smart AI Recruiter to enhance your talent acquisition.")
-        st.session_state.show_thanking_note_single = False
+        _render_single_decision_buttons()
 
 # Add error handling wrapper (uncomment if needed for debugging)
 # try:
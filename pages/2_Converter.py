@@ -5,10 +5,8 @@ Converts candidate CVs to PPT format based on tracker status
 import streamlit as st
 import pandas as pd
 import os
-import re
 from datetime import datetime
 import tempfile
-import requests
 from dotenv import load_dotenv
 
 # Load environment variables from .env
@@ -20,6 +18,7 @@ try:
     from utils_v2.cv_info_extraction import extract_cv_info_for_ppt
     from utils_v2.ppt_operations import read_sample_ppt_structure, create_ppt_from_sample
     from utils_v2.tracker import update_cv_conversion_status
+    from utils_v2.naming import sanitize_name
 except ImportError as e:
     st.error(f"❌ Import Error: {str(e)}")
     st.stop()
@@ -240,10 +239,7 @@ if sample_ppt_file and tracker_file and st.session_state.converter_api_key:
                     
                     # Determine output folder and filename
                     # Clean position name for folder
-                    position_clean = re.sub(r'[^\w\s-]', '', position)
-                    position_clean = position_clean.replace(' ', '_').strip('_')
-                    if not position_clean or position_clean == 'Not_Found':
-                        position_clean = "Not_Found"
+                    position_clean = sanitize_name(position, default="Not_Found")
                     
                     # Create Converted_CVs folder at the same level as Tracker folder
                     # CV path structure: {Client}/{Position}_Candidates/Shortlisted/{file}
@@ -263,10 +259,7 @@ if sample_ppt_file and tracker_file and st.session_state.converter_api_key:
                     
                     # Generate output filename: Current_Date_Position_Candidate_Name.pptx
                     current_date = datetime.now().strftime('%Y%m%d')
-                    candidate_name_clean = re.sub(r'[^\w\s-]', '', candidate_name)
-                    candidate_name_clean = candidate_name_clean.replace(' ', '_').strip('_')
-                    if not candidate_name_clean:
-                        candidate_name_clean = "Unknown"
+                    candidate_name_clean = sanitize_name(candidate_name)
                     
                     output_filename = f"{current_date}_{position_clean}_{candidate_name_clean}.pptx"
                     output_path = os.path.join(converted_folder, output_filename)
@@ -2,31 +2,197 @@
 Analysis functions for resume evaluation and scoring
 """
 import re
-from sklearn.metrics.pairwise import cosine_similarity
+import os
+import asyncio
+import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import streamlit as st
 from utils_v2.client_helper import get_llm_client
 
-# Lazy load SentenceTransformer to avoid slow startup
-_ats_model = None
-
-def _get_ats_model():
-    """Lazy load the SentenceTransformer model only when needed"""
-    global _ats_model
-    if _ats_model is None:
-        from sentence_transformers import SentenceTransformer
-        _ats_model = SentenceTransformer('sentence-transformers/all-mpnet-base-v2')
-    return _ats_model
-
-def calculate_similarity_bert(text1, text2):
-    """Calculate cosine similarity between two texts using BERT embeddings"""
-    # Lazy load model only when this function is called
-    ats_model = _get_ats_model()
-    # Encode the texts directly to embeddings
-    embeddings1 = ats_model.encode([text1])
-    embeddings2 = ats_model.encode([text2])
+ATS_MODEL_NAME = 'sentence-transformers/all-mpnet-base-v2'
+
+# Texts per encode() forward pass; large enough to keep a GPU busy, harmless on CPU
+EMBEDDING_BATCH_SIZE = 64
+
+# Embeddings are cached on disk by model and text digest so a JD or resume is only encoded once.
+# The cache lives under the app root (not the launch cwd) unless EMBEDDING_CACHE_DIR overrides it.
+_EMBEDDING_CACHE_DIR = os.path.join(
+    os.environ.get("EMBEDDING_CACHE_DIR")
+    or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "embeddings"),
+    ATS_MODEL_NAME.replace('/', '_')
+)
+
+# Oldest cached embeddings are pruned past this many files (~3 KB each); checked every _PRUNE_EVERY saves
+_EMBEDDING_CACHE_MAX_FILES = 20000
+_PRUNE_EVERY = 500
+_saves_since_prune = _PRUNE_EVERY  # prune check on the first save of the process
+_prune_lock = threading.Lock()
+
+
+_bert_model_lock = threading.Lock()
+_bert_models = {}
+
+
+def _load_bert_model(name=ATS_MODEL_NAME):
+    """Load the SentenceTransformer model once per process; no Streamlit calls, so safe on any thread"""
+    with _bert_model_lock:
+        model = _bert_models.get(name)
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(name)  # picks CUDA automatically when available
+            if str(model.device).startswith('cuda'):
+                # fp16 halves memory and uses tensor cores; cosine scores are unaffected at this precision
+                model = model.half()
+            _bert_models[name] = model
+        return model
+
+
+@st.cache_resource(show_spinner=False)
+def get_bert_model(name=ATS_MODEL_NAME):
+    """Lazy load the SentenceTransformer model once per Streamlit process (shares the prewarmed instance)"""
+    return _load_bert_model(name)
+
+
+_prewarm_lock = threading.Lock()
+_prewarm_started = False
+
+
+def _prewarm_worker():
+    try:
+        _load_bert_model()
+    except Exception:
+        # Not retried in the background; the first real use loads again and reports the error
+        pass
+
+
+def prewarm_bert_model():
+    """Start loading the BERT model in the background so the first analysis skips the cold start"""
+    global _prewarm_started
+    with _prewarm_lock:
+        if _prewarm_started:
+            return
+        _prewarm_started = True
+    threading.Thread(target=_prewarm_worker, name="bert-prewarm", daemon=True).start()
+
+
+def _text_digest(text):
+    """Stable content key for a text (unlike hash(), identical across processes)"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _embedding_cache_path(text):
+    return os.path.join(_EMBEDDING_CACHE_DIR, f"{_text_digest(text)}.npy")
+
+
+def _save_cached_embedding(cache_path, embedding):
+    # Write to a temp file first so concurrent batch workers never read a partial file
+    try:
+        os.makedirs(_EMBEDDING_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, embedding)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _prune_embedding_cache(saved):
+    """Delete the oldest cached embeddings once the cache grows past _EMBEDDING_CACHE_MAX_FILES"""
+    global _saves_since_prune
+    with _prune_lock:
+        _saves_since_prune += saved
+        if _saves_since_prune < _PRUNE_EVERY:
+            return
+        _saves_since_prune = 0
+    try:
+        entries = [e for e in os.scandir(_EMBEDDING_CACHE_DIR) if e.name.endswith(".npy")]
+    except OSError:
+        return
+    excess = len(entries) - _EMBEDDING_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    # Trim to 90% of the cap so the next pruning pass is not triggered right away
+    excess += _EMBEDDING_CACHE_MAX_FILES // 10
+    def _mtime(entry):
+        try:
+            return entry.stat().st_mtime
+        except OSError:
+            return 0
+    for entry in sorted(entries, key=_mtime)[:excess]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def get_text_embeddings(texts, model=None):
+    """Return an (N, d) float32 array of embeddings for texts
+    
+    Cached embeddings are read from disk; all cache misses are encoded in a single model call.
+    model defaults to the cached get_bert_model() instance.
+    """
+    embeddings = [None] * len(texts)
+    missing = []
+    for idx, text in enumerate(texts):
+        try:
+            embeddings[idx] = np.load(_embedding_cache_path(text))
+        except (OSError, ValueError):
+            missing.append(idx)
+    
+    if missing:
+        model = model or get_bert_model()
+        encoded = np.asarray(model.encode(
+            [texts[idx] for idx in missing],
+            batch_size=EMBEDDING_BATCH_SIZE,
+            normalize_embeddings=True
+        ), dtype=np.float32)
+        for idx, embedding in zip(missing, encoded):
+            embeddings[idx] = embedding
+            _save_cached_embedding(_embedding_cache_path(texts[idx]), embedding)
+        _prune_embedding_cache(len(missing))
+    
+    return np.vstack(embeddings).astype(np.float32, copy=False)
+
+
+def get_text_embedding(text, model=None):
+    """Return the float32 embedding for a single text (see get_text_embeddings)"""
+    return get_text_embeddings([text], model)[0]
+
+
+def batch_similarity(jd_vec, resume_vecs):
+    """Cosine similarity of every row of resume_vecs (N, d) against jd_vec (d,) in one matrix product"""
+    resume_vecs = np.asarray(resume_vecs, dtype=np.float32)
+    jd_vec = np.asarray(jd_vec, dtype=np.float32)
+    norms = np.linalg.norm(resume_vecs, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    jd_norm = np.linalg.norm(jd_vec) or 1.0
+    return (resume_vecs / norms) @ (jd_vec / jd_norm)
+
+
+def _similarity_bert(text1, text2, model=None):
+    embeddings = get_text_embeddings([text1, text2], model)
+    # Same cosine as before, via the numpy helper, so sklearn is not imported at page load
+    return float(batch_similarity(embeddings[0], embeddings[1:])[0])
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_similarity_bert(digest1, digest2, _text1, _text2):
+    """Similarity for a (text1, text2) digest pair, kept in memory across reruns"""
+    return _similarity_bert(_text1, _text2)
+
+
+def calculate_similarity_bert(text1, text2, model=None):
+    """Calculate cosine similarity between two texts using BERT embeddings
     
-    # Calculate cosine similarity without adding an extra list layer
-    similarity = cosine_similarity(embeddings1, embeddings2)[0][0]
-    return similarity
+    With the default model the score is memoized by text digests, so reruns skip even the
+    on-disk embedding reads; an explicit model is always scored directly.
+    """
+    if model is None:
+        return _cached_similarity_bert(_text_digest(text1), _text_digest(text2), text1, text2)
+    return _similarity_bert(text1, text2, model)
 
 
 def get_report(resume, job_desc, api_key, model_name, selected_points=None, temperature=0.0, base_url=None, **kwargs):
@@ -131,15 +297,14 @@ def get_report(resume, job_desc, api_key, model_name, selected_points=None, temp
     return chat_completion.choices[0].message.content
 
 
+# Scores in the format x/5, where x can be an integer or a float
+_SCORE_RE = re.compile(r'(\d+(?:\.\d+)?)/5')
+
+
 def extract_scores(text):
     """Extract scores from report text (format: x/5)"""
-    # Regular expression pattern to find scores in the format x/5, where x can be an integer or a float
-    pattern = r'(\d+(?:\.\d+)?)/5'
-    # Find all matches in the text
-    matches = re.findall(pattern, text)
-    # Convert matches to floats
-    scores = [float(match) for match in matches]
-    return scores
+    # One C-level scan with the precompiled pattern; convert matches to floats
+    return [float(match) for match in _SCORE_RE.findall(text)]
 
 
 def extract_summary_from_report(report_text):
@@ -327,13 +492,21 @@ def extract_failed_points_explanations(report_text):
     return ""
 
 
-def process_single_resume(resume_file, job_desc, api_key, model_name, base_url=None, selected_points=None, experience_requirement=None):
-    """Process a single resume and return all analysis results"""
-    from utils_v2.text_extraction import extract_resume_text
+def process_single_resume(resume_file, job_desc, api_key, model_name, base_url=None, selected_points=None, experience_requirement=None,
+                          resume_text=None, similarity_score=None, min_similarity=None):
+    """Process a single resume and return all analysis results
+    
+    resume_text and similarity_score may be passed in when the caller has already
+    computed them (e.g. batch processing scores all resumes in one pass).
+    When min_similarity is set and the similarity score is below it, the LLM report is
+    skipped (the candidate cannot pass the auto-decision) and 'fast_rejected' is True.
+    """
+    from utils_v2.text_extraction import extract_resume_text_cached
     from utils_v2.llm_functions import extract_position_from_jd, extract_candidate_details_llm
     
     # Extract resume text
-    resume_text = extract_resume_text(resume_file)
+    if resume_text is None:
+        resume_text = extract_resume_text_cached(resume_file)
     
     if not resume_text or not resume_text.strip():
         return {
@@ -348,11 +521,15 @@ def process_single_resume(resume_file, job_desc, api_key, model_name, base_url=N
         }
     
     # Calculate similarity score
-    ats_score = calculate_similarity_bert(resume_text, job_desc) if (resume_text.strip() and job_desc.strip()) else 0.0
+    if similarity_score is not None:
+        ats_score = similarity_score
+    else:
+        ats_score = calculate_similarity_bert(resume_text, job_desc) if (resume_text.strip() and job_desc.strip()) else 0.0
     
-    # Get analysis report
+    # Get analysis report (not needed when the similarity score alone already rejects)
+    fast_rejected = min_similarity is not None and ats_score < min_similarity
     report = ""
-    if api_key:
+    if api_key and not fast_rejected:
         report = get_report(
             resume_text,
             job_desc,
@@ -373,7 +550,7 @@ def process_single_resume(resume_file, job_desc, api_key, model_name, base_url=N
     if job_desc and job_desc.strip() and api_key:
         try:
             position = extract_position_from_jd(job_desc, api_key, model_name, base_url)
-        except:
+        except Exception:
             position = "Not Found"
     
     # Extract candidate details
@@ -384,7 +561,7 @@ def process_single_resume(resume_file, job_desc, api_key, model_name, base_url=N
             candidate_details = extract_candidate_details_llm(resume_text, api_key, model_name, base_url)
             if candidate_details:
                 candidate_name = candidate_details.get('Candidate_Name', 'Not Found')
-        except:
+        except Exception:
             candidate_details = None
     
     return {
@@ -398,6 +575,122 @@ def process_single_resume(resume_file, job_desc, api_key, model_name, base_url=N
         'average_score': avg_score,
         'report': report,
         'report_scores': report_scores,
+        'fast_rejected': fast_rejected,
         'error': None
     }
 
+
+def _batch_error_result(resume_file, error):
+    """Result entry for a resume that raised while being processed in a batch"""
+    return {
+        'resume_file': resume_file.name if resume_file else 'Unknown',
+        'error': f'Error processing: {str(error)}',
+        'candidate_name': 'Error',
+        'position': 'Error',
+        'similarity_score': 0.0,
+        'average_score': 0.0,
+        'report': '',
+        'candidate_details': None
+    }
+
+
+# Batches smaller than this extract text in threads; the process pool only pays off above it
+PROCESS_POOL_MIN_FILES = 4
+
+
+async def _process_resumes_async(resume_files, job_desc, api_key, model_name, base_url,
+                                 selected_points, experience_requirement, max_concurrency, on_result,
+                                 min_similarity=None):
+    """Run process_single_resume for every file, at most max_concurrency at a time"""
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+    from utils_v2.text_extraction import extract_resume_text_cached, get_extraction_pool
+
+    # Worker threads share the script run context so st.* calls inside the helpers still work
+    ctx = get_script_run_ctx()
+    sem = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+    results = [None] * len(resume_files)
+    # Parsing is CPU-bound, so larger batches go to worker processes; small ones are not worth the hop
+    process_pool = get_extraction_pool() if len(resume_files) >= PROCESS_POOL_MIN_FILES else None
+
+    async def _extract_one(resume_file):
+        try:
+            if process_pool is not None:
+                # Threads only check the cache and wait on the process pool, so no semaphore here
+                return await loop.run_in_executor(executor, extract_resume_text_cached, resume_file, process_pool)
+            async with sem:
+                return await loop.run_in_executor(executor, extract_resume_text_cached, resume_file)
+        except Exception as e:
+            return e
+
+    async def _process_one(idx, resume_file, resume_text, similarity_score):
+        async with sem:
+            try:
+                result = await loop.run_in_executor(executor, functools.partial(
+                    process_single_resume,
+                    resume_file,
+                    job_desc,
+                    api_key,
+                    model_name,
+                    base_url,
+                    selected_points,
+                    experience_requirement=experience_requirement,
+                    resume_text=resume_text,
+                    similarity_score=similarity_score,
+                    min_similarity=min_similarity
+                ))
+            except Exception as e:
+                result = _batch_error_result(resume_file, e)
+        return idx, result
+
+    # LLM work is bounded by sem; the extra threads let cache misses keep every pool process busy
+    with ThreadPoolExecutor(
+        max_workers=max(max_concurrency, os.cpu_count() or 1),
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as executor:
+        texts = await asyncio.gather(*[_extract_one(resume_file) for resume_file in resume_files])
+
+        # Score every extracted resume against the JD with one batched encode and one matrix product
+        scores = [None] * len(resume_files)
+        scored = [idx for idx, text in enumerate(texts)
+                  if isinstance(text, str) and text.strip() and job_desc.strip()]
+        if scored:
+            vecs = get_text_embeddings([job_desc] + [texts[idx] for idx in scored])
+            for idx, score in zip(scored, batch_similarity(vecs[0], vecs[1:])):
+                scores[idx] = float(score)
+
+        tasks = []
+        for idx, resume_file in enumerate(resume_files):
+            if isinstance(texts[idx], Exception):
+                results[idx] = _batch_error_result(resume_file, texts[idx])
+                continue
+            tasks.append(_process_one(idx, resume_file, texts[idx] or "", scores[idx]))
+
+        done = len(resume_files) - len(tasks)
+        for task in asyncio.as_completed(tasks):
+            idx, result = await task
+            results[idx] = result
+            done += 1
+            if on_result:
+                on_result(done, len(resume_files), result)
+
+    return results
+
+
+def process_resumes_batch(resume_files, job_desc, api_key, model_name, base_url=None, selected_points=None,
+                          experience_requirement=None, max_concurrency=4, on_result=None, min_similarity=None):
+    """Process several resumes concurrently and return their results in upload order
+    
+    LLM round-trips dominate the time per resume, so the files are processed in parallel
+    with at most max_concurrency in flight. on_result(done, total, result) is called from
+    the calling thread as each resume finishes (e.g. to advance a progress bar).
+    min_similarity is passed to process_single_resume to skip reports for resumes that
+    already fail the similarity threshold.
+    """
+    if not resume_files:
+        return []
+    return asyncio.run(_process_resumes_async(
+        resume_files, job_desc, api_key, model_name, base_url,
+        selected_points, experience_requirement, max(1, int(max_concurrency)), on_result,
+        min_similarity=min_similarity
+    ))
@@ -2,8 +2,19 @@
 Helper functions for creating unified LLM clients
 Supports any OpenAI-compatible API provider
 """
+import hashlib
+import threading
+from collections import OrderedDict
+import httpx
 from openai import OpenAI
 
+# One pooled HTTP transport for every LLM client so batch calls reuse TCP/TLS connections.
+# HTTP/1.1 keep-alive only: http2=True needs the optional h2 package, which is not a dependency.
+_http_client = httpx.Client(
+    timeout=httpx.Timeout(60.0, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+)
+
 
 def detect_base_url(api_key):
     """Auto-detect base URL from API key pattern
@@ -52,7 +63,7 @@ def get_llm_client(api_key, base_url=None):
         base_url: Optional base URL. If not provided, auto-detects from API key
         
     Returns:
-        OpenAI client instance configured for the provider
+        OpenAI client instance configured for the provider (reused for the same key and URL)
     """
     if not api_key:
         raise ValueError("API key is required")
@@ -61,12 +72,31 @@ def get_llm_client(api_key, base_url=None):
     if not base_url:
         base_url = detect_base_url(api_key)
     
-    # Create OpenAI client with provider-specific base_url
-    # This works for any OpenAI-compatible API
-    client = OpenAI(
-        base_url=base_url,
-        api_key=api_key
-    )
-    
-    return client
+    return _cached_llm_client(api_key, base_url)
+
+
+# Clients keyed on (key digest, base URL) so raw API keys never sit in a cache key; least recently used dropped first
+_CLIENT_CACHE_SIZE = 16
+_clients = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def _cached_llm_client(api_key, base_url):
+    cache_key = (hashlib.blake2b(str(api_key).encode('utf-8'), digest_size=16).hexdigest(), base_url)
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is not None:
+            _clients.move_to_end(cache_key)
+            return client
+        # Create OpenAI client with provider-specific base_url
+        # This works for any OpenAI-compatible API
+        client = OpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            http_client=_http_client
+        )
+        _clients[cache_key] = client
+        if len(_clients) > _CLIENT_CACHE_SIZE:
+            _clients.popitem(last=False)
+        return client
 
@@ -0,0 +1,136 @@
+"""
+Static Home page content, rendered from markdown to HTML once at import time
+"""
+import markdown
+
+# Python-Markdown needs 4-space indentation for nested lists
+_HOME_MD = """
+## 📋 Project Overview
+
+**Smart AI Recruiter** is an intelligent resume screening application that leverages
+Artificial Intelligence and Large Language Models (LLMs) to automate and enhance the
+recruitment process. The application analyzes candidate resumes against job descriptions
+to provide comprehensive evaluation reports and similarity scores.
+
+## ✨ Key Features
+
+<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
+<div>
+<p><strong>🤖 AI-Powered Analysis</strong></p>
+<ul>
+<li>LLM-based resume evaluation</li>
+<li>Detailed scoring and feedback</li>
+<li>Multi-criteria assessment</li>
+</ul>
+<p><strong>📊 Similarity Scoring</strong></p>
+<ul>
+<li>BERT-based semantic similarity</li>
+<li>ATS (Applicant Tracking System) compatibility</li>
+<li>Quantitative match scores</li>
+</ul>
+</div>
+<div>
+<p><strong>📝 Document Processing</strong></p>
+<ul>
+<li>PDF, DOC, DOCX support</li>
+<li>Automatic text extraction</li>
+<li>Batch processing capability</li>
+</ul>
+<p><strong>📈 Candidate Tracking</strong></p>
+<ul>
+<li>Excel-based tracker system</li>
+<li>Duplicate detection</li>
+<li>Status management</li>
+</ul>
+</div>
+</div>
+
+<hr>
+
+## 🛠️ Technology Stack
+
+- **Frontend**: Streamlit (Python Web Framework)
+- **LLM Providers**: Groq, OpenRouter
+- **NLP Models**:
+    - Sentence Transformers (BERT-based embeddings)
+    - Various LLM models (Llama, GPT, etc.)
+- **Text Processing**:
+    - pdfminer, PyPDF (PDF extraction)
+    - docx2txt (DOCX extraction)
+    - olefile (Legacy DOC extraction)
+- **Data Management**:
+    - Pandas (Excel operations)
+    - Session state management
+
+<hr>
+
+## 🔄 How It Works
+
+1. **Input Job Description**: Upload or paste the job description
+2. **Extract Evaluation Criteria**: AI automatically extracts key evaluation points
+3. **Upload Resume(s)**: Single or batch resume processing
+4. **AI Analysis**:
+    - Calculate similarity score using BERT embeddings
+    - Generate detailed evaluation report using LLM
+    - Extract candidate information
+5. **Review & Decision**: Review results and shortlist/reject candidates
+6. **Track Candidates**: Automatically update Excel tracker with candidate details
+
+<hr>
+
+## 📑 Application Pages
+
+- **🏠 Home**: Project information and overview (current page)
+- **🔍 Screener**: Main resume screening functionality
+- **🔄 Converter**: Document conversion tools (coming soon)
+"""
+
+
+HOME_HTML = markdown.markdown(_HOME_MD, extensions=['tables', 'fenced_code', 'toc'])
+
+
+_QUICKSTART_MD = """
+### Step 1: Configure Settings
+- Go to the **Screener** page
+- In the sidebar, select your LLM provider (Groq or OpenRouter)
+- Enter your API key
+- Select the model you want to use
+
+### Step 2: Enter Client Information
+- Enter the client name (e.g., HSBC, Unilever)
+- Optionally enter vendor name and profile shared date
+
+### Step 3: Provide Job Description
+- Choose between text input or document upload
+- Wait for evaluation criteria to be extracted automatically
+
+### Step 4: Select Evaluation Criteria
+- Review the extracted evaluation points
+- Select which criteria to use for assessment
+- Set the minimum experience requirement
+
+### Step 5: Upload Resume(s)
+- Choose between Single or Batch processing
+- Select Experiment or Production method
+- Upload resume file(s)
+
+### Step 6: Analyze
+- Click the "Analyze" button
+- Review the similarity score and detailed report
+- Make shortlist/reject decisions
+
+### Step 7: Track Candidates
+- Candidates are automatically saved to Excel tracker
+- CVs are organized in folder structure
+- Duplicate detection prevents re-processing
+"""
+
+
+QUICKSTART_HTML = markdown.markdown(_QUICKSTART_MD)
+
+
+FOOTER_HTML = """
+<div style='text-align: center; color: gray;'>
+    <p>Smart AI Recruiter v1.0 | Developed by Harshal Kshatriya and Team</p>
+</div>
+"""
@@ -4,9 +4,71 @@ LLM-powered extraction functions for job descriptions and resumes
 import streamlit as st
 import re
 import json
+import time
+import hashlib
 from datetime import datetime
+import openai
 from utils_v2.client_helper import get_llm_client
 
+# Errors worth retrying: rate limits, timeouts, dropped connections and 5xx responses
+_TRANSIENT_LLM_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+def _chat_completion_with_retry(client, attempts=4, base_delay=0.5, max_delay=8.0, **kwargs):
+    """Call chat.completions.create, retrying transient errors with exponential backoff
+    
+    Other errors (bad key, unknown model, bad request) are raised immediately.
+    The client's own retries are disabled so the attempts do not multiply.
+    """
+    client = client.with_options(max_retries=0)
+    for attempt in range(attempts):
+        try:
+            return client.chat.completions.create(**kwargs)
+        except _TRANSIENT_LLM_ERRORS:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(min(max_delay, base_delay * (2 ** attempt)))
+
+
+def _digest(value):
+    """Short blake2b digest so JD text and API keys never appear in cache keys"""
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_llm_position(jd_digest, model_name, base_url, api_key_digest, _job_description, _api_key):
+    """LLM job-title answer for a JD, or None if it gave no usable title
+    
+    Cached on (JD digest, model, base URL, key digest); API errors propagate and are not cached.
+    """
+    # Use unified client (works with any OpenAI-compatible API)
+    client = get_llm_client(_api_key, base_url)
+    
+    prompt = f"""Extract the job title from this job description. Return ONLY the job title (e.g., "Data Analyst", "Java Developer"). If not found, return "Not Found".
+
+{_job_description[:2500]}
+
+Job Title:"""
+    
+    chat_completion = _chat_completion_with_retry(
+        client,
+        messages=[{"role": "user", "content": prompt}],
+        model=model_name,
+        temperature=0.0,
+    )
+    
+    response = chat_completion.choices[0].message.content.strip()
+    position = response.split('\n')[0].strip().strip('"\'')
+    
+    if position and len(position) >= 2 and len(position) <= 50 and 'not found' not in position.lower():
+        return position
+    return None
+
 
 def extract_position_from_jd(job_description, api_key, model_name, base_url=None):
     """Extract position/job title from job description - fast check first, then LLM, then regex
@@ -36,30 +98,16 @@ def extract_position_from_jd(job_description, api_key, model_name, base_url=None
                         # This looks like a job title - return it
                         return ' '.join(word.capitalize() for word in words)
     
-    # Try LLM extraction if API key available
+    # Try LLM extraction if API key available (memoized per JD, so repeat clicks skip the round trip)
     if api_key:
         try:
-            # Use unified client (works with any OpenAI-compatible API)
-            client = get_llm_client(api_key, base_url)
-            
-            prompt = f"""Extract the job title from this job description. Return ONLY the job title (e.g., "Data Analyst", "Java Developer"). If not found, return "Not Found".
-
-{job_description[:2500]}
-
-Job Title:"""
-            
-            chat_completion = client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=model_name,
-                temperature=0.0,
+            position = _cached_llm_position(
+                _digest(job_description), model_name, base_url, _digest(api_key), job_description, api_key
             )
-            
-            response = chat_completion.choices[0].message.content.strip()
-            position = response.split('\n')[0].strip().strip('"\'')
-            
-            if position and len(position) >= 2 and len(position) <= 50 and 'not found' not in position.lower():
+            if position:
                 return position
-        except:
+        except (openai.OpenAIError, IndexError, AttributeError):
+            # LLM unavailable or returned an unusable reply - fall through to regex
             pass
     
     # Regex fallback - search for job title patterns in first 10 lines
@@ -87,20 +135,14 @@ Job Title:"""
     return "Not Found"
 
 
-def extract_candidate_details_llm(resume_text, api_key, model_name, base_url=None):
-    """Extract candidate details using LLM
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_candidate_details(resume_digest, model_name, base_url, api_key_digest, _resume_text, _api_key):
+    """Parsed LLM candidate details for a resume
     
-    Args:
-        resume_text: Resume text
-        api_key: API key for LLM provider
-        model_name: Model name to use
-        base_url: Optional base URL for API. If not provided, auto-detects from API key
+    Cached on (resume digest, model, base URL, key digest); API and JSON errors propagate and are not cached.
     """
-    if not resume_text:
-        return None
-    
     # Use unified client (works with any OpenAI-compatible API)
-    client = get_llm_client(api_key, base_url)
+    client = get_llm_client(_api_key, base_url)
     
     prompt = f"""
     You are a resume parser. Extract the following information from the resume text below and return ONLY a valid JSON object.
@@ -127,62 +169,79 @@ def extract_candidate_details_llm(resume_text, api_key, model_name, base_url=Non
     6. Ensure the JSON is valid and properly formatted
 
     Resume Text:
-    {resume_text[:5000]}
+    {_resume_text[:5000]}
+    """
+    
+    chat_completion = client.chat.completions.create(
+        messages=[{"role": "user", "content": prompt}],
+        model=model_name,
+        temperature=0.0,
+    )
+    
+    response = chat_completion.choices[0].message.content.strip()
+    
+    # Clean response to extract JSON
+    if '```json' in response:
+        response = response.split('```json')[1].split('```')[0].strip()
+    elif '```' in response:
+        response = response.split('```')[1].split('```')[0].strip()
+
+    # If the model returned an empty/blank response, fall back silently
+    if not response or not response.strip():
+        raise json.JSONDecodeError("empty response", response, 0)
+
+    # Try to find JSON object in the response
+    start_idx = response.find('{')
+    end_idx = response.rfind('}') + 1
+
+    if start_idx != -1 and end_idx != 0:
+        json_str = response[start_idx:end_idx].strip()
+        if not json_str:
+            raise json.JSONDecodeError("no json object found", json_str, 0)
+        details = json.loads(json_str)
+    else:
+        # Fall back to parsing the whole response only if non-empty
+        details = json.loads(response)
+    
+    # Validate required keys
+    required_keys = ['Candidate_Name', 'Contact_Number', 'Email_ID', 'Total_Experience', 'Location']
+    for key in required_keys:
+        if key not in details:
+            details[key] = 'Not Found'
+    
+    return details
+
+
+def extract_candidate_details_llm(resume_text, api_key, model_name, base_url=None, use_fallback=True):
+    """Extract candidate details using LLM
+    
+    Args:
+        resume_text: Resume text
+        api_key: API key for LLM provider
+        model_name: Model name to use
+        base_url: Optional base URL for API. If not provided, auto-detects from API key
+        use_fallback: If False, return None instead of the regex fallback when the LLM call fails
     """
+    if not resume_text:
+        return None
     
     try:
-        chat_completion = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model=model_name,
-            temperature=0.0,
+        # st.cache_data hands back a fresh copy, so callers may mutate the dict freely
+        details = _cached_candidate_details(
+            _digest(resume_text), model_name, base_url, _digest(api_key), resume_text, api_key
         )
-        
-        response = chat_completion.choices[0].message.content.strip()
-        
-        # Try to parse JSON response
-        try:
-            # Clean response to extract JSON
-            if '```json' in response:
-                response = response.split('```json')[1].split('```')[0].strip()
-            elif '```' in response:
-                response = response.split('```')[1].split('```')[0].strip()
-
-            # If the model returned an empty/blank response, fall back silently
-            if not response or not response.strip():
-                raise json.JSONDecodeError("empty response", response, 0)
-
-            # Try to find JSON object in the response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-
-            if start_idx != -1 and end_idx != 0:
-                json_str = response[start_idx:end_idx].strip()
-                if not json_str:
-                    raise json.JSONDecodeError("no json object found", json_str, 0)
-                details = json.loads(json_str)
-            else:
-                # Fall back to parsing the whole response only if non-empty
-                details = json.loads(response)
-            
-            # Validate required keys
-            required_keys = ['Candidate_Name', 'Contact_Number', 'Email_ID', 'Total_Experience', 'Location']
-            for key in required_keys:
-                if key not in details:
-                    details[key] = 'Not Found'
-            
-            # Add additional fields
-            details['Resume_Screening_Status'] = 'Shortlisted'
-            details['Screening_Date'] = datetime.now().strftime('%Y-%m-%d')
-            
-            return details
-            
-        except json.JSONDecodeError:
-            # Quiet fallback: do not surface low-level JSON errors to the UI
-            return extract_details_fallback(resume_text)
-            
+    except json.JSONDecodeError:
+        # Quiet fallback: do not surface low-level JSON errors to the UI
+        return extract_details_fallback(resume_text) if use_fallback else None
     except Exception as e:
         st.error(f"Error extracting candidate details: {str(e)}")
-        return extract_details_fallback(resume_text)
+        return extract_details_fallback(resume_text) if use_fallback else None
+    
+    # Add additional fields (outside the cache so the date stays current)
+    details['Resume_Screening_Status'] = 'Shortlisted'
+    details['Screening_Date'] = datetime.now().strftime('%Y-%m-%d')
+    
+    return details
 
 
 def extract_details_fallback(resume_text):
@@ -318,6 +377,22 @@ def extract_details_fallback(resume_text):
     return details
 
 
+class _NoEvaluationPoints(Exception):
+    """Raised inside the cached call so an empty LLM reply is not memoized"""
+
+
+@st.cache_data(show_spinner=False)
+def _cached_evaluation_points(jd_digest, model_name, base_url, api_key_digest, _job_desc, _api_key):
+    """LLM evaluation-point extraction, cached on (JD digest, model, base URL, key digest)
+    
+    The underscore-prefixed arguments are excluded from the cache key by Streamlit.
+    """
+    points = _request_evaluation_points(_job_desc, _api_key, model_name, base_url)
+    if not points:
+        raise _NoEvaluationPoints()
+    return points
+
+
 def extract_evaluation_points(job_desc, api_key, model_name, base_url=None):
     """Extract all possible evaluation points/criteria from job description
     
@@ -334,10 +409,23 @@ def extract_evaluation_points(job_desc, api_key, model_name, base_url=None):
         return []
     
     try:
-        # Use unified client (works with any OpenAI-compatible API)
-        client = get_llm_client(api_key, base_url)
-        
-        prompt = f"""Extract all possible evaluation criteria/points from the following job description. 
+        # Copy so callers can edit the list without touching the cached value
+        return list(_cached_evaluation_points(
+            _digest(job_desc), model_name, base_url, _digest(api_key), job_desc, api_key
+        ))
+    except _NoEvaluationPoints:
+        return []
+    except Exception as e:
+        st.error(f"Error extracting evaluation points: {str(e)}")
+        return []
+
+
+def _request_evaluation_points(job_desc, api_key, model_name, base_url=None):
+    """Ask the LLM for evaluation points and parse the numbered list (errors propagate)"""
+    # Use unified client (works with any OpenAI-compatible API)
+    client = get_llm_client(api_key, base_url)
+    
+    prompt = f"""Extract all possible evaluation criteria/points from the following job description. 
 List each evaluation point as a separate, concise criterion that can be used to assess a candidate's resume.
 
 For example:
@@ -359,38 +447,34 @@ Each criterion should be specific and measurable. Format as:
 3. [Criterion 3]
 ...
 """
+    
+    chat_completion = client.chat.completions.create(
+        messages=[{"role": "user", "content": prompt}],
+        model=model_name,
+        temperature=0.0,
+    )
+    
+    response = chat_completion.choices[0].message.content.strip()
+    
+    # Parse the response into a list of evaluation points
+    points = []
+    lines = response.split('\n')
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
         
-        chat_completion = client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model=model_name,
-            temperature=0.0,
-        )
-        
-        response = chat_completion.choices[0].message.content.strip()
-        
-        # Parse the response into a list of evaluation points
-        points = []
-        lines = response.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Remove numbering (e.g., "1. ", "1)", "- ", "* ")
-            line = re.sub(r'^\d+[\.\)]\s*', '', line)
-            line = re.sub(r'^[-•*]\s*', '', line)
-            line = line.strip()
-            
-            # Remove markdown formatting
-            line = re.sub(r'\*\*|\*|_', '', line)
-            
-            if line and len(line) > 3:  # Minimum length check
-                points.append(line)
+        # Remove numbering (e.g., "1. ", "1)", "- ", "* ")
+        line = re.sub(r'^\d+[\.\)]\s*', '', line)
+        line = re.sub(r'^[-•*]\s*', '', line)
+        line = line.strip()
         
-        return points if points else []
+        # Remove markdown formatting
+        line = re.sub(r'\*\*|\*|_', '', line)
         
-    except Exception as e:
-        st.error(f"Error extracting evaluation points: {str(e)}")
-        return []
+        if line and len(line) > 3:  # Minimum length check
+            points.append(line)
+    
+    return points
 
@@ -0,0 +1,36 @@
+"""
+Helpers for turning position and candidate names into folder/file name parts
+"""
+import functools
+import os
+import re
+
+# Characters stripped from position/candidate names before using them in folder and file names
+_SANITIZE_RE = re.compile(r'[^\w\s-]')
+_SPACE_TO_UNDERSCORE = str.maketrans(' ', '_')
+
+# ASCII-only equivalent of _SANITIZE_RE plus the space mapping, applied in one C-level pass
+_ASCII_SANITIZE_TABLE = str.maketrans(
+    {chr(i): None for i in range(128) if not re.match(r'[\w\s-]', chr(i))} | {' ': '_'}
+)
+
+
+def sanitize_name(value, default="Unknown"):
+    """Strip unsafe characters, turn spaces into underscores, and fall back to default if nothing is left"""
+    value = value or ''
+    if value.isascii():
+        cleaned = value.translate(_ASCII_SANITIZE_TABLE)
+    else:
+        # \w is Unicode-aware, so non-ASCII names keep the regex path
+        cleaned = _SANITIZE_RE.sub('', value).translate(_SPACE_TO_UNDERSCORE)
+    return cleaned.strip('_') or default
+
+
+@functools.lru_cache(maxsize=128)
+def position_folder(base_folder, position):
+    """(sanitized position, absolute <position>_Candidates folder) under base_folder
+    
+    Pure path math, memoized per process; the tracker helpers create the folders on first write.
+    """
+    position_clean = sanitize_name(position, default="Not_Found")
+    return position_clean, os.path.join(os.path.abspath(base_folder), f"{position_clean}_Candidates")
@@ -5,16 +5,70 @@ import streamlit as st
 import tempfile
 import os
 import re
+import io
+import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pdfminer.high_level import extract_text
 from pypdf import PdfReader
 import docx2txt
 import olefile
 
 
+# Set while extract_resume_bytes runs so extractor errors go back to the caller
+_error_sink = threading.local()
+
+
+def _report_error(message):
+    """st.error, unless errors are being collected (worker processes have no script run context)"""
+    errors = getattr(_error_sink, 'errors', None)
+    if errors is not None:
+        errors.append(message)
+    else:
+        st.error(message)
+
+
+def _pdf_has_fonts(reader):
+    """Cheap text-layer probe: True if any page references a font (or a form that may hold one)
+    
+    Scanned (image-only) PDFs have no fonts, so neither extractor can find text in them.
+    Only the page dictionaries are read, no content streams. Errors err on the side of True.
+    """
+    try:
+        for page in reader.pages:
+            resources = page.get('/Resources')
+            resources = resources.get_object() if resources is not None else None
+            if not resources:
+                continue
+            if resources.get('/Font'):
+                return True
+            # Form XObjects carry their own resources (and can hold the text); only images are conclusive
+            xobjects = resources.get('/XObject')
+            xobjects = xobjects.get_object() if xobjects is not None else {}
+            for xobject in xobjects.values():
+                if xobject.get_object().get('/Subtype') != '/Image':
+                    return True
+        return False
+    except Exception:
+        return True
+
+
 def extract_pdf_text(uploaded_file):
     """Extract text from PDF file"""
+    # One PdfReader serves both the text-layer probe and the pypdf fallback, so the file is parsed once
+    try:
+        uploaded_file.seek(0)
+        reader = PdfReader(uploaded_file)
+        reader_error = None
+    except Exception as e:
+        reader, reader_error = None, e
+    # Image-only PDF: skip both full parses, the result would be empty anyway
+    if reader is not None and not _pdf_has_fonts(reader):
+        return ""
     # First try pdfminer
     try:
+        uploaded_file.seek(0)
         extracted_text = extract_text(uploaded_file) or ""
         if extracted_text and extracted_text.strip():
             return extracted_text
@@ -23,8 +77,8 @@ def extract_pdf_text(uploaded_file):
         pass
     # Fallback to pypdf
     try:
-        uploaded_file.seek(0)
-        reader = PdfReader(uploaded_file)
+        if reader is None:
+            raise reader_error
         pages_text = []
         for page in reader.pages:
             try:
@@ -35,7 +89,7 @@ def extract_pdf_text(uploaded_file):
         combined = "\n".join(pages_text)
         return combined
     except Exception as e:
-        st.error(f"Error extracting text from PDF: {str(e)}")
+        _report_error(f"Error extracting text from PDF: {str(e)}")
         return ""
 
 
@@ -84,8 +138,7 @@ def extract_docx_text(uploaded_file):
                 except Exception:
                     pass
     except Exception as e:
-        if 'st' in globals():
-            st.error(f"Error extracting text from DOCX: {str(e)}")
+        _report_error(f"Error extracting text from DOCX: {str(e)}")
         return ""
 
 
@@ -192,7 +245,7 @@ def extract_doc_text(uploaded_file):
             except Exception:
                 pass
     except Exception as e:
-        st.error(f"Error extracting text from DOC: {str(e)}")
+        _report_error(f"Error extracting text from DOC: {str(e)}")
         return ""
 
 
@@ -205,10 +258,72 @@ def extract_resume_text(uploaded_file):
         return extract_docx_text(uploaded_file)
     if filename.endswith(".doc"):
         return extract_doc_text(uploaded_file)
-    st.error("Unsupported file type. Please upload a PDF, DOC, or DOCX file.")
+    _report_error("Unsupported file type. Please upload a PDF, DOC, or DOCX file.")
     return ""
 
 
+def extract_resume_bytes(filename, data):
+    """Process-pool entry point: extract resume text from raw file bytes
+    
+    Streamlit UploadedFile objects cannot be pickled, so workers get the name and bytes
+    and rebuild an in-memory file the existing extractors accept.
+    Returns (text, error_message); the message is None unless an extractor reported an error.
+    """
+    buffer = io.BytesIO(data)
+    buffer.name = filename
+    _error_sink.errors = []
+    try:
+        text = extract_resume_text(buffer)
+        errors = _error_sink.errors
+    finally:
+        _error_sink.errors = None
+    return text, ("; ".join(errors) if errors else None)
+
+
+@st.cache_resource(show_spinner=False)
+def get_extraction_pool():
+    """Process pool for CPU-bound parsing (pdfminer is pure Python and holds the GIL)
+    
+    Created once per server process; "spawn" avoids forking the threaded Streamlit server.
+    """
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+class _ExtractionFailed(Exception):
+    """Raised out of _cached_resume_text so st.cache_data does not store a failed extraction"""
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_resume_text(digest, filename, _data, _pool=None):
+    """Resume text keyed on the file's content digest and name (the bytes themselves are not hashed again)"""
+    if _pool is not None:
+        text, error = _pool.submit(extract_resume_bytes, filename, _data).result()
+    else:
+        text, error = extract_resume_bytes(filename, _data)
+    if not (text and text.strip()):
+        raise _ExtractionFailed(error)
+    return text
+
+
+def extract_resume_text_cached(uploaded_file, pool=None):
+    """extract_resume_text, memoized by content so re-uploads and re-runs skip re-parsing
+    
+    On a cache miss the parsing runs in pool (see get_extraction_pool) when one is given.
+    Failed or empty extractions are not cached; their error is shown here, in the caller's script context.
+    """
+    data = uploaded_file.getvalue()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    try:
+        return _cached_resume_text(digest, uploaded_file.name or "", data, pool)
+    except _ExtractionFailed as e:
+        if e.args[0]:
+            st.error(e.args[0])
+        return ""
+
+
 def extract_jd_text(uploaded_file):
     """Function to extract text from JD documents (reuse existing extractors)"""
     filename = (uploaded_file.name or "").lower()
@@ -4,9 +4,98 @@ Excel tracker functions for candidate management
 import pandas as pd
 import os
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
 
+_TRACKER_FILENAME = "Candidates_Tracker.xlsx"
+
+# Normalized cell values that mean "no value" in tracker columns
+_EMPTY_MARKERS = ['not found', '', 'nan', 'none']
+
+# Last parsed tracker per workbook path: {excel_path: ((mtime_ns, size), DataFrame)}, least recently used dropped first
+_TRACKER_READ_CACHE = OrderedDict()
+_TRACKER_READ_CACHE_SIZE = 8
+_tracker_read_lock = threading.Lock()
+
+# Manual columns that users will fill (always empty by default), kept last in this order
+_MANUAL_COLUMNS = (
+    'R1_Schedule_Date',
+    'R1_Panel_Name',
+    'R1_Feedback',
+    'R1_Status',
+    'R2_Schedule_Date',
+    'R2_Panel_Name',
+    'R2_Feedback',
+    'R2_Status',
+    'CV_Conversion_Status',
+    'CV_Converted_Path',
+)
+
+
+def _tracker_excel_path(folder_name):
+    """Path of the unified tracker file for a position folder"""
+    return os.path.join(os.path.normpath(folder_name), "Tracker", _TRACKER_FILENAME)
+
+
+def _ensure_tracker_folders(folder_name):
+    """Create the Shortlisted/ and Tracker/ subfolders of a position folder"""
+    # Create unified folder structure: Client_Name/Position_Candidates/Shortlisted/ and Tracker/
+    os.makedirs(os.path.join(folder_name, "Shortlisted"), exist_ok=True)
+    os.makedirs(os.path.join(folder_name, "Tracker"), exist_ok=True)
+
+
+def _strip_phone_punctuation(contacts):
+    """Remove spaces, dashes and brackets from normalized phone strings, leaving the empty markers as they are"""
+    return contacts.where(contacts.isin(_EMPTY_MARKERS), contacts.str.replace(r'[\s\-\(\)]', '', regex=True))
+
+
+def _file_stamp(path):
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_tracker_df(excel_path):
+    """Read the tracker workbook, or return None if it does not exist or cannot be read
+    
+    The parsed sheet is kept per path and reused while the file's mtime/size are unchanged,
+    so repeated Shortlist/Reject clicks do not re-parse the workbook. Callers get a copy.
+    """
+    stamp = _file_stamp(excel_path)
+    if stamp is None:
+        return None
+    with _tracker_read_lock:
+        cached = _TRACKER_READ_CACHE.get(excel_path)
+        if cached is not None and cached[0] == stamp:
+            _TRACKER_READ_CACHE.move_to_end(excel_path)
+            return cached[1].copy()
+    try:
+        df = pd.read_excel(excel_path)
+    except Exception:
+        return None
+    # Only cache if no other session rewrote the workbook while it was being read
+    if _file_stamp(excel_path) == stamp:
+        with _tracker_read_lock:
+            _TRACKER_READ_CACHE[excel_path] = (stamp, df)
+            _TRACKER_READ_CACHE.move_to_end(excel_path)
+            if len(_TRACKER_READ_CACHE) > _TRACKER_READ_CACHE_SIZE:
+                _TRACKER_READ_CACHE.popitem(last=False)
+    return df.copy()
+
+
+def _write_tracker_df(df, excel_path):
+    """Save the tracker workbook; xlsxwriter streams the sheet out much faster than openpyxl"""
+    try:
+        df.to_excel(excel_path, index=False, engine="xlsxwriter")
+    except ImportError:
+        df.to_excel(excel_path, index=False)
+
+
 def check_candidate_status_in_tracker(candidate_details, folder_name, vendor_name=""):
     """Check if candidate exists in tracker and return current status
     
@@ -22,21 +111,19 @@ def check_candidate_status_in_tracker(candidate_details, folder_name, vendor_nam
             - duplicate_reason: Reason code if duplicate
             - profile_remark: Profile remark if exists
     """
-    # Normalize folder path (handle both relative and absolute paths)
-    folder_name = os.path.normpath(folder_name)
-    tracker_folder = os.path.join(folder_name, "Tracker")
-    excel_path = os.path.join(tracker_folder, "Candidates_Tracker.xlsx")
-    
-    if not os.path.exists(excel_path):
+    excel_path = _tracker_excel_path(folder_name)
+    df = _read_tracker_df(excel_path)
+    if df is None or df.empty:
         return False, None, "", ""
     
-    try:
-        df = pd.read_excel(excel_path)
-        if df.empty:
-            return False, None, "", ""
-    except:
-        return False, None, "", ""
+    return _check_candidate_in_df(df, candidate_details, vendor_name)
+
+
+def _check_candidate_in_df(df, candidate_details, vendor_name=""):
+    """Look up a candidate in an already-loaded, non-empty tracker DataFrame
     
+    Same matching rules and return value as check_candidate_status_in_tracker.
+    """
     email_id = candidate_details.get('Email_ID', '')
     candidate_name = candidate_details.get('Candidate_Name', '')
     contact_number = candidate_details.get('Contact_Number', '')
@@ -51,11 +138,12 @@ def check_candidate_status_in_tracker(candidate_details, folder_name, vendor_nam
         contact_number_norm = re.sub(r'[\s\-\(\)]', '', contact_number_norm)
     
     # Check by email first
-    if email_id_norm and 'Email_ID' in df.columns:
+    if email_id_norm and 'Email_ID' in df.columns and email_id_norm not in _EMPTY_MARKERS:
+        # Normalize the column once and reuse it for the membership test and the row selection
         existing_emails = df['Email_ID'].astype(str).str.strip().str.lower()
-        valid_emails = existing_emails[~existing_emails.isin(['not found', '', 'nan', 'none'])]
-        if not valid_emails.empty and email_id_norm in valid_emails.values:
-            matching_rows = df[df['Email_ID'].astype(str).str.strip().str.lower() == email_id_norm]
+        email_match = existing_emails == email_id_norm
+        if email_match.any():
+            matching_rows = df[email_match]
             if not matching_rows.empty:
                 # Check ALL matching rows for same vendor first (Scenario 2.3: prevent same vendor duplicates)
                 if 'Vendor_Name' in df.columns:
@@ -85,7 +173,7 @@ def check_candidate_status_in_tracker(candidate_details, folder_name, vendor_nam
     if candidate_name_norm and contact_number_norm and 'Candidate_Name' in df.columns and 'Contact_Number' in df.columns:
         df_name_norm = df['Candidate_Name'].astype(str).str.strip().str.lower()
         df_contact_norm = df['Contact_Number'].astype(str).str.strip().str.lower()
-        df_contact_norm = df_contact_norm.apply(lambda x: re.sub(r'[\s\-\(\)]', '', x) if x not in ['not found', '', 'nan', 'none'] else x)
+        df_contact_norm = _strip_phone_punctuation(df_contact_norm)
         
         valid_rows = (~df_name_norm.isin(['not found', '', 'nan', 'none'])) & (~df_contact_norm.isin(['not found', '', 'nan', 'none']))
         
@@ -185,25 +273,45 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
     """
     # Normalize folder path (handle both relative and absolute paths)
     folder_name = os.path.normpath(folder_name)
+    _ensure_tracker_folders(folder_name)
     
-    # Create unified folder structure: Client_Name/Position_Candidates/Shortlisted/ and Tracker/
-    shortlisted_folder = os.path.join(folder_name, "Shortlisted")
-    os.makedirs(shortlisted_folder, exist_ok=True)
+    # Single unified tracker file
+    excel_path = _tracker_excel_path(folder_name)
     
-    tracker_folder = os.path.join(folder_name, "Tracker")
-    os.makedirs(tracker_folder, exist_ok=True)
+    df, added, duplicate_reason, profile_remark, current_status = _apply_tracker_update(
+        _read_tracker_df(excel_path), candidate_details, tracker_type, feedback, similarity_score,
+        average_score, cv_path, vendor_name, profile_shared_date, allow_status_change
+    )
+    if df is not None:
+        # Save to Excel
+        _write_tracker_df(df, excel_path)
     
-    # Single unified tracker file
-    excel_filename = "Candidates_Tracker.xlsx"
-    excel_path = os.path.join(tracker_folder, excel_filename)
+    return excel_path, added, duplicate_reason, profile_remark, current_status
+
+
+def _apply_tracker_update(tracker_df, candidate_details, tracker_type, feedback, similarity_score, average_score,
+                          cv_path, vendor_name, profile_shared_date, allow_status_change):
+    """Apply one candidate to an in-memory tracker DataFrame (core of update_tracker_excel)
+    
+    Args:
+        tracker_df: Tracker as read from disk, or None if there is no tracker yet
+        (remaining arguments as for update_tracker_excel)
     
+    Returns:
+        tuple: (df, added, duplicate_reason, profile_remark, current_status)
+            - df: Updated tracker to save, or None if nothing should be written
+            - remaining values as returned by update_tracker_excel
+    """
     # FIRST COME FIRST SERVE LOGIC: Check if candidate already exists
     desired_status = "Shortlisted" if tracker_type.lower() == "shortlisted" else "Rejected"
     
     # Check if candidate exists in tracker
-    exists, current_status, duplicate_reason, existing_profile_remark = check_candidate_status_in_tracker(
-        candidate_details, folder_name, vendor_name
-    )
+    if tracker_df is not None and not tracker_df.empty:
+        exists, current_status, duplicate_reason, existing_profile_remark = _check_candidate_in_df(
+            tracker_df, candidate_details, vendor_name
+        )
+    else:
+        exists, current_status, duplicate_reason, existing_profile_remark = False, None, "", ""
     
     # Track if this is a different vendor duplicate (will be added with "Duplicate Profile")
     is_different_vendor_duplicate = False
@@ -212,7 +320,7 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
     if exists:
         # If same vendor duplicate, prevent entry
         if duplicate_reason.endswith("_same_vendor"):
-            return excel_path, False, duplicate_reason, existing_profile_remark, current_status
+            return None, False, duplicate_reason, existing_profile_remark, current_status
         
         # If different vendor duplicate, allow entry but mark as "Duplicate Profile"
         # This allows tracking same candidate from different vendors
@@ -223,12 +331,12 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
             # Continue processing below to add the entry (don't return, fall through)
         elif not allow_status_change:
             # Same vendor but different status change attempt - prevent (first come first serve)
-            return excel_path, False, "already_exists", existing_profile_remark, current_status
+            return None, False, "already_exists", existing_profile_remark, current_status
         else:
             # Admin override: Update existing record's status
-            # Read existing tracker
+            # Work on a copy of the existing tracker
             try:
-                df = pd.read_excel(excel_path)
+                df = tracker_df.copy()
                 # Find and update the existing row
                 email_id = candidate_details.get('Email_ID', '')
                 candidate_name = candidate_details.get('Candidate_Name', '')
@@ -250,7 +358,7 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
                 elif candidate_name_norm and contact_number_norm and 'Candidate_Name' in df.columns and 'Contact_Number' in df.columns:
                     df_name_norm = df['Candidate_Name'].astype(str).str.strip().str.lower()
                     df_contact_norm = df['Contact_Number'].astype(str).str.strip().str.lower()
-                    df_contact_norm = df_contact_norm.apply(lambda x: re.sub(r'[\s\-\(\)]', '', x) if x not in ['not found', '', 'nan', 'none'] else x)
+                    df_contact_norm = _strip_phone_punctuation(df_contact_norm)
                     valid_rows = (~df_name_norm.isin(['not found', '', 'nan', 'none'])) & (~df_contact_norm.isin(['not found', '', 'nan', 'none']))
                     if valid_rows.any():
                         name_match = df_name_norm[valid_rows] == candidate_name_norm
@@ -271,8 +379,7 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
                     elif tracker_type.lower() == "rejected":
                         df.loc[matching_idx, 'Shortlisted_CV_Path'] = ''  # Clear CV path if rejecting
                     
-                    df.to_excel(excel_path, index=False)
-                    return excel_path, True, "status_updated", existing_profile_remark, desired_status
+                    return df, True, "status_updated", existing_profile_remark, desired_status
             except Exception:
                 pass  # If update fails, fall through to add new logic
     
@@ -282,9 +389,9 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
         profile_remark = "Unique Profile"
     
     # Read tracker to check for duplicates (skip if already identified as different vendor duplicate)
-    if os.path.exists(excel_path):
+    if tracker_df is not None:
         try:
-            df = pd.read_excel(excel_path)
+            df = tracker_df.copy()
             # Rename old column name if exists
             if 'Date_Shortlisted' in df.columns:
                 if 'Screening_Date' not in df.columns:
@@ -296,22 +403,8 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
                 except Exception:
                     pass
             
-            # Define manual columns that users will fill (always empty by default)
-            manual_columns = [
-                'R1_Schedule_Date',
-                'R1_Panel_Name',
-                'R1_Feedback',
-                'R1_Status',
-                'R2_Schedule_Date',
-                'R2_Panel_Name',
-                'R2_Feedback',
-                'R2_Status',
-                'CV_Conversion_Status',
-                'CV_Converted_Path'
-            ]
-            
             # Add manual columns to existing tracker if they don't exist (backward compatibility)
-            for col in manual_columns:
+            for col in _MANUAL_COLUMNS:
                 if col not in df.columns:
                     df[col] = ""
         except:
@@ -347,7 +440,7 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
                             if vendor_name_norm and existing_vendor and vendor_name_norm == existing_vendor:
                                 # Same vendor duplicate found - BLOCK
                                 current_status_inner = row.get('Resume_Screening_Status', 'Unknown')
-                                return excel_path, False, "email_same_vendor", row.get('Profile_Remark', ''), current_status_inner
+                                return None, False, "email_same_vendor", row.get('Profile_Remark', ''), current_status_inner
                         # No same vendor found - check for different vendor
                         existing_vendor = str(matching_rows.iloc[0]['Vendor_Name']).strip().lower() if pd.notna(matching_rows.iloc[0]['Vendor_Name']) else ""
                         if vendor_name_norm and existing_vendor and vendor_name_norm != existing_vendor:
@@ -358,7 +451,7 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
                 if 'Candidate_Name' in df.columns and 'Contact_Number' in df.columns:
                     df_name_norm = df['Candidate_Name'].astype(str).str.strip().str.lower()
                     df_contact_norm = df['Contact_Number'].astype(str).str.strip().str.lower()
-                    df_contact_norm = df_contact_norm.apply(lambda x: re.sub(r'[\s\-\(\)]', '', x) if x not in ['not found', '', 'nan', 'none'] else x)
+                    df_contact_norm = _strip_phone_punctuation(df_contact_norm)
                     valid_rows = (~df_name_norm.isin(['not found', '', 'nan', 'none'])) & (~df_contact_norm.isin(['not found', '', 'nan', 'none']))
                     if valid_rows.any():
                         name_match = df_name_norm[valid_rows] == candidate_name_norm
@@ -372,7 +465,7 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
                                     if vendor_name_norm and existing_vendor and vendor_name_norm == existing_vendor:
                                         # Same vendor duplicate found - BLOCK
                                         current_status_inner = row.get('Resume_Screening_Status', 'Unknown')
-                                        return excel_path, False, "name_and_phone_same_vendor", row.get('Profile_Remark', ''), current_status_inner
+                                        return None, False, "name_and_phone_same_vendor", row.get('Profile_Remark', ''), current_status_inner
                                 # No same vendor found - check for different vendor
                                 existing_vendor = str(matching_rows.iloc[0]['Vendor_Name']).strip().lower() if pd.notna(matching_rows.iloc[0]['Vendor_Name']) else ""
                                 if vendor_name_norm and existing_vendor and vendor_name_norm != existing_vendor:
@@ -398,7 +491,7 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
                                 if vendor_name_norm and existing_vendor and vendor_name_norm == existing_vendor:
                                     # Same vendor + same name found (even without contact number) - BLOCK
                                     current_status_inner = row.get('Resume_Screening_Status', 'Unknown')
-                                    return excel_path, False, "name_and_vendor_same_vendor", row.get('Profile_Remark', ''), current_status_inner
+                                    return None, False, "name_and_vendor_same_vendor", row.get('Profile_Remark', ''), current_status_inner
     
     # Add Vendor_Name, Profile_Shared_Date, and Profile_Remark as first columns
     candidate_details['Vendor_Name'] = vendor_name if vendor_name else ""
@@ -442,22 +535,8 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
     if 'Position' not in candidate_details:
         candidate_details['Position'] = 'Not Found'
     
-    # Define manual columns that users will fill (always empty by default)
-    manual_columns = [
-        'R1_Schedule_Date',
-        'R1_Panel_Name',
-        'R1_Feedback',
-        'R1_Status',
-        'R2_Schedule_Date',
-        'R2_Panel_Name',
-        'R2_Feedback',
-        'R2_Status',
-        'CV_Conversion_Status',
-        'CV_Converted_Path'
-    ]
-    
     # Initialize manual columns as empty strings in candidate_details
-    for col in manual_columns:
+    for col in _MANUAL_COLUMNS:
         candidate_details[col] = ""
     
     # Add new candidate data
@@ -535,34 +614,66 @@ def update_tracker_excel(candidate_details, tracker_type="shortlisted", folder_n
             cols.remove('Position')
             cols.insert(email_idx + 1, 'Position')
     
-    # Define manual columns that users will fill (always empty by default)
-    manual_columns = [
-        'R1_Schedule_Date',
-        'R1_Panel_Name',
-        'R1_Feedback',
-        'R1_Status',
-        'R2_Schedule_Date',
-        'R2_Panel_Name',
-        'R2_Feedback',
-        'R2_Status',
-        'CV_Conversion_Status',
-        'CV_Converted_Path'
-    ]
-    
     # Ensure manual columns are at the end (in specified order)
-    for col in manual_columns:
+    for col in _MANUAL_COLUMNS:
         if col in cols:
             cols.remove(col)
     # Append manual columns at the end
-    cols.extend(manual_columns)
+    cols.extend(_MANUAL_COLUMNS)
     
     # Apply column ordering to DataFrame
     df = df[cols]
     
-    # Save to Excel
-    df.to_excel(excel_path, index=False)
+    return df, True, "", profile_remark, None  # Return True to indicate successful addition
+
+
+class TrackerSession:
+    """Buffered tracker updates for one position folder
     
-    return excel_path, True, "", profile_remark, None  # Return True to indicate successful addition
+    Loads Candidates_Tracker.xlsx once, applies check/update calls to the in-memory
+    DataFrame with the same rules as check_candidate_status_in_tracker/update_tracker_excel,
+    and writes the workbook once on flush(). Used by batch processing so N candidates cost
+    one read and one save instead of N of each.
+    """
+
+    def __init__(self, folder_name):
+        self.folder_name = os.path.normpath(folder_name)
+        _ensure_tracker_folders(self.folder_name)
+        self.excel_path = _tracker_excel_path(self.folder_name)
+        self._df = _read_tracker_df(self.excel_path)
+        self._dirty = False
+
+    def check_candidate_status(self, candidate_details, vendor_name=""):
+        """Same as check_candidate_status_in_tracker, against the buffered tracker"""
+        if self._df is None or self._df.empty:
+            return False, None, "", ""
+        return _check_candidate_in_df(self._df, candidate_details, vendor_name)
+
+    def update(self, candidate_details, tracker_type="shortlisted", feedback="", similarity_score=0.0, average_score=0.0,
+               cv_path="", vendor_name="", profile_shared_date=None, allow_status_change=False):
+        """Same as update_tracker_excel, but the change is only saved on flush()"""
+        df, added, duplicate_reason, profile_remark, current_status = _apply_tracker_update(
+            self._df, candidate_details, tracker_type, feedback, similarity_score,
+            average_score, cv_path, vendor_name, profile_shared_date, allow_status_change
+        )
+        if df is not None:
+            self._df = df
+            self._dirty = True
+        return self.excel_path, added, duplicate_reason, profile_remark, current_status
+
+    def flush(self):
+        """Write the buffered tracker to disk if anything changed"""
+        if self._dirty:
+            _write_tracker_df(self._df, self.excel_path)
+            self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
 
 
 def update_cv_conversion_status(tracker_path, candidate_email=None, candidate_name=None, contact_number=None, converted_ppt_path=""):
@@ -610,7 +721,7 @@ def update_cv_conversion_status(tracker_path, candidate_email=None, candidate_na
             if 'Candidate_Name' in df.columns and 'Contact_Number' in df.columns:
                 df_name_norm = df['Candidate_Name'].astype(str).str.strip().str.lower()
                 df_contact_norm = df['Contact_Number'].astype(str).str.strip().str.lower()
-                df_contact_norm = df_contact_norm.apply(lambda x: re.sub(r'[\s\-\(\)]', '', x) if x not in ['not found', '', 'nan', 'none'] else x)
+                df_contact_norm = _strip_phone_punctuation(df_contact_norm)
                 valid_rows = (~df_name_norm.isin(['not found', '', 'nan', 'none'])) & (~df_contact_norm.isin(['not found', '', 'nan', 'none']))
                 if valid_rows.any():
                     name_match = df_name_norm[valid_rows] == name_norm
@@ -633,7 +744,7 @@ def update_cv_conversion_status(tracker_path, candidate_email=None, candidate_na
             df.loc[matching_idx, 'CV_Converted_Path'] = converted_ppt_path
         
         # Save updated tracker
-        df.to_excel(tracker_path, index=False)
+        _write_tracker_df(df, tracker_path)
         
         candidate_display = candidate_name or candidate_email or "Candidate"
         return True, f"Successfully updated {candidate_display}"